@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, RedirectResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import asyncio
@@ -54,6 +55,9 @@ pdf_generator = PDFGenerator()
 pptx_generator = PPTXGenerator()
 controlled_source_manager = ControlledSourceManager()
 
+# Strong references to fire-and-forget preview persistence tasks
+background_preview_tasks = set()
+
 # Database connection startup event
 @app.on_event("startup")
 async def startup_event():
@@ -65,6 +69,8 @@ async def startup_event():
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
         # Don't fail startup, but log the error
+    
+    await presentation_generator.start_preview_renderer()
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -72,6 +78,9 @@ async def shutdown_event():
     try:
         await db_manager.close()
         await controlled_source_manager.close()
+        await pdf_generator.close()
+        await pptx_generator.close()
+        await presentation_generator.close()
         print("✅ Database connection closed")
     except Exception as e:
         print(f"❌ Error closing database: {e}")
@@ -202,6 +211,40 @@ async def get_progress(presentation_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Get preview images (generated in the background after the presentation is saved)
+@app.get("/presentations/{presentation_id}/previews")
+async def get_previews(presentation_id: str):
+    try:
+        status = pdf_generator.get_preview_status(presentation_id)
+        if status is None:
+            status = {
+                "previewStatus": "completed",
+                "previewUrls": await db_manager.get_presentation_previews(presentation_id)
+            }
+        # Previews are stored as s3:// references or local paths; hand out fetchable URLs
+        status["previewUrls"] = pdf_generator.preview_urls(presentation_id, status["previewUrls"])
+        return status
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Download an uploaded PPTX deck through a freshly presigned bucket URL
+@app.get("/presentations/{presentation_id}/download")
+async def download_presentation(presentation_id: str):
+    url = await asyncio.to_thread(pptx_generator.get_download_url, presentation_id)
+    if url is None:
+        raise HTTPException(status_code=404, detail="Presentation file not found")
+    return RedirectResponse(url)
+
+# Serve a preview image kept on local disk (used when no preview bucket is configured)
+@app.get("/presentations/{presentation_id}/previews/{page}")
+async def get_preview_image(presentation_id: str, page: int):
+    status = pdf_generator.get_preview_status(presentation_id)
+    previews = status["previewUrls"] if status else await db_manager.get_presentation_previews(presentation_id)
+    path = previews[page] if 0 <= page < len(previews) else None
+    if not path or path.startswith('s3://') or not await asyncio.to_thread(os.path.isfile, path):
+        raise HTTPException(status_code=404, detail="Preview not found")
+    return FileResponse(path, media_type="image/jpeg")
+
 # Generate embeddings endpoint
 @app.post("/embeddings/generate")
 async def generate_embedding(request: dict):
@@ -458,6 +501,42 @@ async def find_similar_slides(query_embedding: list, industry: str = None, limit
         print(f"Error finding similar slides: {e}")
         return []
 
+def store_previews_in_background(presentation_id: str, presentation_data: Dict[str, Any]):
+    """Persist preview URLs once background preview generation finishes"""
+    if presentation_data.get('previewStatus') != 'generating':
+        return
+    
+    async def store_previews():
+        try:
+            preview_urls = await pdf_generator.wait_for_previews(presentation_id)
+            await db_manager.update_presentation_previews(presentation_id, preview_urls)
+        finally:
+            # Keep answering status reads from the task until the database has the URLs
+            pdf_generator.release_previews(presentation_id)
+    
+    task = asyncio.create_task(store_previews())
+    background_preview_tasks.add(task)
+    task.add_done_callback(background_preview_tasks.discard)
+
+def schedule_pptx_previews(presentation_id: str, presentation_data: Dict[str, Any]):
+    """Render previews of a generated PPTX in the background (LibreOffice -> PDF -> thumbnails)
+    
+    The job is tracked by pdf_generator like PDF previews, so the previews endpoint and
+    store_previews_in_background handle both formats.
+    """
+    local_path = presentation_data.pop('localPath', None)
+    if not local_path or not presentation_generator.can_render_previews:
+        return
+    
+    # A copy written only for previewing is removed once the previews exist
+    discard_source = local_path != presentation_data['filepath']
+    pdf_generator.track_previews(
+        presentation_id,
+        presentation_generator.render_pptx_previews(local_path, presentation_id, discard_source=discard_source)
+    )
+    presentation_data['previewUrls'] = []
+    presentation_data['previewStatus'] = 'generating'
+
 # Main generation function
 async def generate_presentation_async(presentation_id: str, request_data: Dict[str, Any]):
     """Main async function to handle presentation generation using ONLY uploaded content"""
@@ -606,6 +685,9 @@ async def generate_with_embeddings(presentation_id: str, request_data: Dict[str,
         print(f"   - Minor Enhancement: {minor_enhancement_count} slides (~{minor_enhancement_count * 50} tokens)")
         print(f"   - Full Generation: {full_generation_count} slides (~{full_generation_count * 200} tokens)")
         
+        # Pull S3-stored image blobs for the selected slides only
+        await controlled_source_manager.load_slide_images(matched_slides)
+        
         # Generate final presentation based on output format
         output_format = request_data.get('outputFormat', 'pdf').lower()
         print(f"🚀 GENERATING PRESENTATION IN {output_format.upper()} FORMAT...")
@@ -614,8 +696,10 @@ async def generate_with_embeddings(presentation_id: str, request_data: Dict[str,
             presentation_data = await pptx_generator.generate_presentation(
                 slides=matched_slides,
                 presentation_id=presentation_id,
-                request_data=request_data
+                request_data=request_data,
+                write_local_copy=presentation_generator.can_render_previews
             )
+            schedule_pptx_previews(presentation_id, presentation_data)
         else:  # Default to PDF
             presentation_data = await pdf_generator.generate_presentation(
                 slides=matched_slides,
@@ -638,6 +722,7 @@ async def generate_with_embeddings(presentation_id: str, request_data: Dict[str,
             presentation_data=presentation_data,
             status="completed"
         )
+        store_previews_in_background(presentation_id, presentation_data)
         
         # Final progress update
         await db_manager.update_progress(
@@ -696,8 +781,8 @@ async def generate_without_embeddings(presentation_id: str, request_data: Dict[s
         all_slides = []
         for source in approved_sources[:10]:  # Limit to top 10
             try:
-                slides = await controlled_source_manager.get_source_slides(source['id'])
-                all_slides.extend(slides)
+                async for slide in controlled_source_manager.iter_source_slides(source['id']):
+                    all_slides.append(slide)
             except Exception as e:
                 print(f"Failed to extract slides from approved source {source['id']}: {e}")
                 continue
@@ -740,6 +825,9 @@ async def generate_without_embeddings(presentation_id: str, request_data: Dict[s
             f"Generating presentation with {len(matched_slides)} selected slides..."
         )
         
+        # Pull S3-stored image blobs for the selected slides only
+        await controlled_source_manager.load_slide_images(matched_slides)
+        
         # Step 4: Generate final presentation based on output format
         output_format = request_data.get('outputFormat', 'pdf').lower()
         print(f"🚀 GENERATING PRESENTATION IN {output_format.upper()} FORMAT...")
@@ -748,8 +836,10 @@ async def generate_without_embeddings(presentation_id: str, request_data: Dict[s
             presentation_data = await pptx_generator.generate_presentation(
                 slides=matched_slides,
                 presentation_id=presentation_id,
-                request_data=request_data
+                request_data=request_data,
+                write_local_copy=presentation_generator.can_render_previews
             )
+            schedule_pptx_previews(presentation_id, presentation_data)
         else:  # Default to PDF
             presentation_data = await pdf_generator.generate_presentation(
                 slides=matched_slides,
@@ -772,6 +862,7 @@ async def generate_without_embeddings(presentation_id: str, request_data: Dict[s
             presentation_data=presentation_data,
             status="completed"
         )
+        store_previews_in_background(presentation_id, presentation_data)
         
         # Final progress update
         await db_manager.update_progress(
@@ -185,6 +185,36 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error updating presentation status: {e}")
     
+    async def update_presentation_previews(self, presentation_id: str, preview_urls: List[str]):
+        """Store preview image references generated after the presentation was saved"""
+        
+        try:
+            async with self.connection_pool.acquire() as conn:
+                await conn.execute("""
+                    UPDATE presentations 
+                    SET preview_url = $1, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = $2
+                """, json.dumps(preview_urls), presentation_id)
+                
+        except Exception as e:
+            logger.error(f"Error updating presentation previews: {e}")
+    
+    async def get_presentation_previews(self, presentation_id: str) -> List[str]:
+        """Get stored preview image references (s3:// objects or local paths) for a presentation"""
+        
+        try:
+            async with self.connection_pool.acquire() as conn:
+                preview_url = await conn.fetchval("""
+                    SELECT preview_url FROM presentations 
+                    WHERE id = $1
+                """, presentation_id)
+                
+                return json.loads(preview_url) if preview_url else []
+                
+        except Exception as e:
+            logger.error(f"Error getting presentation previews: {e}")
+            return []
+    
     async def get_presentation_slides(self, presentation_id: str) -> List[Dict[str, Any]]:
         """Get slides for a presentation"""
         
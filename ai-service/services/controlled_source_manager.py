@@ -1,31 +1,159 @@
 import asyncio
 import asyncpg
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator, Union
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pptx import Presentation
-import json
+from lxml import etree
+import zipfile
+import orjson
 import boto3
+from boto3.s3.transfer import TransferConfig
 import tempfile
+import copy
+import io
 from urllib.parse import urlparse
-import base64
+import pybase64
+import hashlib
+from botocore.config import Config
+from botocore.exceptions import ClientError
+import re
+import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columns returned by the source list queries (full rows via get_source_detail).
+# Keep in sync with the INCLUDE list of idx_presentation_sources_listing_covering.
+_SOURCE_SUMMARY_COLUMNS = """
+    ps.id, ps.title, ps.industry, ps.tags, ps.file_path, ps.status,
+    ps.relevance_score, ps.created_at, ps.slide_count
+"""
+
+# Filtered source listing; kept as one fixed statement so it is prepared once per connection
+_APPROVED_SOURCES_QUERY = f"""
+    SELECT {_SOURCE_SUMMARY_COLUMNS}
+    FROM presentation_sources ps
+    WHERE ps.status = 'approved'
+    AND ($1::varchar IS NULL OR ps.industry = $1)
+    AND ($2::text[] IS NULL OR ps.tags && $2)
+    ORDER BY ps.relevance_score DESC, ps.created_at DESC
+    LIMIT $3
+"""
+
+# Columns returned by slide queries (everything generation needs, minus bookkeeping).
+# slide_type comes from the generated slide_type_auto column classified in SQL.
+_SLIDE_COLUMNS = """
+    ss.id, ss.source_id, ss.slide_index, ss.title, ss.content, ss.image_url,
+    ss.slide_type_auto AS slide_type, ss.metadata, ss.images, ss.formatting, ss.layout_info
+"""
+
+# Keyword patterns used by _classify_slide_type, one alternation per field so each
+# slide is scanned in a single pass. Keywords match as substrings ("charts" is a chart).
+# The content pattern is a zero-width lookahead so overlapping keywords are all seen
+# (e.g. "statistics" inside "next stepstatistics"). Group names are the slide type
+# (checked in _CONTENT_TYPE_PRIORITY order). Keep in sync with the slide_type_auto
+# generated column in the backend schema.
+_TITLE_TYPE_RE = re.compile(r'title|agenda|overview')
+_CONTENT_TYPE_RE = re.compile(
+    r'(?=(?P<chart>chart|graph|data|statistics)'
+    r'|(?P<quote>quote|testimonial|feedback)'
+    r'|(?P<conclusion>conclusion|summary|next steps))'
+)
+_CONTENT_TYPE_PRIORITY = ('chart', 'quote', 'conclusion')
+
+# Rows fetched per round-trip when streaming through a server-side cursor
+_CURSOR_PREFETCH = 500
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a Python value as binary jsonb (version byte + JSON text)"""
+    return b'\x01' + orjson.dumps(value)
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Decode binary jsonb (version byte + JSON text) into a Python value"""
+    return orjson.loads(data[1:])
+
+MB = 1024 * 1024
+
+# Batches larger than this are written with COPY instead of executemany
+_COPY_THRESHOLD = 200
+
+# Slides parsed per batch and batches buffered between parsing and inserts in the ingest pipeline
+_SLIDE_BATCH_SIZE = 200
+_PIPELINE_QUEUE_DEPTH = 4
+
+# Smallest slide range worth shipping to a worker process (each worker re-opens the deck)
+_MIN_SLIDES_PER_WORKER = 10
+
+_SLIDE_ID_TAG = '{http://schemas.openxmlformats.org/presentationml/2006/main}sldId'
+
+def _count_pptx_slides(presentation_path: Union[str, io.BytesIO]) -> int:
+    """Count slides from the deck's slide id list without loading the full presentation"""
+    with zipfile.ZipFile(presentation_path) as archive:
+        root = etree.fromstring(archive.read('ppt/presentation.xml'))
+    return sum(1 for _ in root.iter(_SLIDE_ID_TAG))
+
+# S3 decks up to this size are downloaded into memory instead of a temp file
+_INMEMORY_DOWNLOAD_MAX = int(os.getenv('S3_INMEMORY_MAX_MB', 64)) * MB
+
+# Per-process manager used by extraction workers (created lazily in each worker)
+_worker_manager = None
+
+def _parse_pptx_worker(
+    source_id: str,
+    presentation_path: Union[str, bytes],
+    start: int = 0,
+    stop: Optional[int] = None,
+    include_images: bool = True,
+    include_formatting: bool = True
+) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], bytes]]]:
+    """Parse slides [start:stop] of a presentation file in a worker process (must stay module-level to be picklable)"""
+    global _worker_manager
+    if _worker_manager is None:
+        _worker_manager = ControlledSourceManager()
+    return _worker_manager._parse_presentation(source_id, presentation_path, start, stop, include_images, include_formatting)
+
 class ControlledSourceManager:
     def __init__(self):
         self.database_url = os.getenv('DATABASE_URL', 'postgresql://localhost:5432/presentation_generator')
         self.connection_pool = None
+        self.slide_insert_chunk = int(os.getenv('SLIDE_INSERT_CHUNK', 1000))
+        # Short in-process TTL cache for read-only source listings, cleared on every write here;
+        # the TTL bounds staleness for approvals the backend makes directly in Postgres
+        self.cache_ttl = float(os.getenv('SOURCE_CACHE_TTL', 30))
+        self._query_cache: Dict[tuple, Tuple[float, Any]] = {}
+        self._process_pool = None
         self.s3_client = None
+        # Parallel ranged GETs with large read buffers for big presentation files
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * MB,
+            multipart_chunksize=16 * MB,
+            max_concurrency=32,
+            io_chunksize=1 * MB,
+            use_threads=True
+        )
+        # boto3 calls are blocking; run them here so transfers don't stall the event loop
+        self._s3_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='s3')
+        # Slide images go to this bucket (content-addressed) instead of base64 in JSONB when set
+        self.image_bucket = os.getenv('SLIDE_IMAGE_BUCKET')
         self._init_s3_client()
     
     def _init_s3_client(self):
         """Initialize S3 client with AWS credentials"""
         try:
+            # Connection pool sized above the transfer concurrency so parallel
+            # downloads don't serialize on HTTPS handshakes; adaptive retries back off on 503s
+            s3_config = Config(
+                max_pool_connections=64,
+                tcp_keepalive=True,
+                retries={'max_attempts': 10, 'mode': 'adaptive'},
+                s3={'addressing_style': 'virtual'}
+            )
             self.s3_client = boto3.client(
                 's3',
-                region_name=os.getenv('AWS_REGION', 'ap-south-1')
+                region_name=os.getenv('AWS_REGION', 'ap-south-1'),
+                config=s3_config
             )
             logger.info("S3 client initialized successfully")
         except Exception as e:
@@ -35,121 +163,193 @@ class ControlledSourceManager:
     async def connect(self):
         """Connect to the database"""
         try:
+            # Pool is opened eagerly at app startup; sized so concurrent extractions
+            # don't queue on acquire, with a larger per-connection statement cache
             self.connection_pool = await asyncpg.create_pool(
                 self.database_url,
-                min_size=1,
-                max_size=10,
-                command_timeout=60
+                min_size=int(os.getenv('PG_POOL_MIN', 5)),
+                max_size=int(os.getenv('PG_POOL_MAX', 32)),
+                max_inactive_connection_lifetime=300,
+                max_queries=50000,
+                command_timeout=60,
+                statement_cache_size=1024,
+                init=self._init_connection
             )
             logger.info("Connected to controlled source database")
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise e
     
+    async def _init_connection(self, conn):
+        """Register the jsonb codec so dicts and lists are (de)serialized inside the driver"""
+        await conn.set_type_codec(
+            'jsonb',
+            encoder=_encode_jsonb,
+            decoder=_decode_jsonb,
+            schema='pg_catalog',
+            format='binary'
+        )
+    
+    def _cache_get(self, key: tuple) -> Any:
+        """Return a cached query result, or None if missing or expired"""
+        entry = self._query_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._query_cache[key]
+            return None
+        return value
+    
+    def _cache_set(self, key: tuple, value: Any) -> Any:
+        """Cache a query result for cache_ttl seconds and return it"""
+        if self.cache_ttl > 0:
+            self._query_cache[key] = (time.monotonic() + self.cache_ttl, value)
+        return value
+    
+    def _invalidate_cache(self):
+        """Drop all cached source query results after sources or slides change"""
+        self._query_cache.clear()
+    
     async def close(self):
         """Close database connection"""
         if self.connection_pool:
             await self.connection_pool.close()
+        if self._process_pool:
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+        self._s3_pool.shutdown(wait=False)
     
-    async def get_approved_sources(self, industry: str = None, tags: List[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the shared process pool used for CPU-bound slide extraction"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._process_pool
+    
+    async def get_approved_sources(self, industry: str = None, tags: List[str] = None, limit: int = 20) -> List[asyncpg.Record]:
         """Get approved presentation sources with optional filtering"""
         try:
-            if not self.connection_pool:
-                await self.connect()
-                
+            cache_key = ('approved_sources', industry, tuple(tags or ()), limit)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
             async with self.connection_pool.acquire() as conn:
-                # Build query with optional filters
-                where_conditions = ["ps.status = 'approved'"]
-                params = []
-                param_count = 0
-                
-                if industry:
-                    param_count += 1
-                    where_conditions.append(f"ps.industry = ${param_count}")
-                    params.append(industry)
-                
-                if tags:
-                    param_count += 1
-                    where_conditions.append(f"ps.tags && ${param_count}")
-                    params.append(tags)
-                
-                where_clause = " AND ".join(where_conditions)
-                params.append(limit)
-                
-                query = f"""
-                    SELECT ps.*, 
-                           COUNT(ss.id) as slide_count
-                    FROM presentation_sources ps
-                    LEFT JOIN source_slides ss ON ps.id = ss.source_id
-                    WHERE {where_clause}
-                    GROUP BY ps.id
-                    ORDER BY ps.relevance_score DESC, ps.created_at DESC
-                    LIMIT ${param_count + 1}
-                """
-                
-                rows = await conn.fetch(query, *params)
-                return [dict(row) for row in rows]
+                # Optional filters are bound as NULL when unused so the SQL text never
+                # changes and asyncpg's statement cache can reuse the prepared plan
+                rows = await conn.fetch(
+                    _APPROVED_SOURCES_QUERY,
+                    industry or None,
+                    tags or None,
+                    limit
+                )
+                # Source rows are read-only for callers, so hand back the Records as-is
+                return self._cache_set(cache_key, rows)
                 
         except Exception as e:
             logger.error(f"Error getting approved sources: {e}")
             return []
 
-    async def get_approved_sources_for_industry(self, industry: str) -> List[Dict[str, Any]]:
+    async def get_approved_sources_for_industry(self, industry: str) -> List[asyncpg.Record]:
         """Get all approved presentation sources for a specific industry"""
         try:
+            cache_key = ('approved_sources_for_industry', industry)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
             async with self.connection_pool.acquire() as conn:
-                rows = await conn.fetch("""
-                    SELECT ps.*, 
-                           COUNT(ss.id) as slide_count
+                rows = await conn.fetch(f"""
+                    SELECT {_SOURCE_SUMMARY_COLUMNS}
                     FROM presentation_sources ps
-                    LEFT JOIN source_slides ss ON ps.id = ss.source_id
                     WHERE ps.status = 'approved' 
                     AND ps.industry = $1
-                    GROUP BY ps.id
                     ORDER BY ps.relevance_score DESC, ps.created_at DESC
                 """, industry)
                 
-                return [dict(row) for row in rows]
+                return self._cache_set(cache_key, rows)
         except Exception as e:
             logger.error(f"Error getting approved sources: {e}")
             return []
     
-    async def get_all_approved_sources(self) -> List[Dict[str, Any]]:
+    async def iter_all_approved_sources(self) -> AsyncIterator[asyncpg.Record]:
+        """Stream all approved presentation sources"""
+        async for row in self._iter_rows(f"""
+            SELECT {_SOURCE_SUMMARY_COLUMNS}
+            FROM presentation_sources ps
+            WHERE ps.status = 'approved'
+            ORDER BY ps.relevance_score DESC, ps.created_at DESC
+        """):
+            yield row
+    
+    async def get_all_approved_sources(self) -> List[asyncpg.Record]:
         """Get all approved presentation sources"""
         try:
-            async with self.connection_pool.acquire() as conn:
-                rows = await conn.fetch("""
-                    SELECT ps.*, 
-                           COUNT(ss.id) as slide_count
-                    FROM presentation_sources ps
-                    LEFT JOIN source_slides ss ON ps.id = ss.source_id
-                    WHERE ps.status = 'approved'
-                    GROUP BY ps.id
-                    ORDER BY ps.relevance_score DESC, ps.created_at DESC
-                """)
-                
-                return [dict(row) for row in rows]
+            cache_key = ('all_approved_sources',)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            return self._cache_set(cache_key, [source async for source in self.iter_all_approved_sources()])
         except Exception as e:
             logger.error(f"Error getting all approved sources: {e}")
             return []
     
-    async def get_source_slides(self, source_id: str) -> List[Dict[str, Any]]:
-        """Get all slides from a specific approved source"""
+    async def get_source_detail(self, source_id: str) -> Optional[asyncpg.Record]:
+        """Get the full row for a single presentation source"""
         try:
             async with self.connection_pool.acquire() as conn:
-                rows = await conn.fetch("""
-                    SELECT * FROM source_slides 
-                    WHERE source_id = $1 
-                    ORDER BY slide_index
+                row = await conn.fetchrow("""
+                    SELECT * FROM presentation_sources
+                    WHERE id = $1
                 """, source_id)
                 
-                return [dict(row) for row in rows]
+                return row
+        except Exception as e:
+            logger.error(f"Error getting source detail: {e}")
+            return None
+    
+    async def iter_source_slides(self, source_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream slides from a specific approved source in slide order"""
+        async for row in self._iter_rows(f"""
+            SELECT {_SLIDE_COLUMNS}
+            FROM source_slides ss
+            WHERE ss.source_id = $1 
+            ORDER BY ss.slide_index
+        """, source_id):
+            # Slides are annotated in place by the matcher and load_slide_images, so these stay dicts
+            yield dict(row)
+    
+    async def get_source_slides(self, source_id: str) -> List[Dict[str, Any]]:
+        """Get all slides from a specific approved source"""
+        try:
+            return [slide async for slide in self.iter_source_slides(source_id)]
         except Exception as e:
             logger.error(f"Error getting source slides: {e}")
             return []
     
-    async def extract_slides_from_source(self, source_id: str, file_path: str, industry: str = None) -> List[Dict[str, Any]]:
-        """Extract slides from a presentation file and store them in the database"""
+    async def _iter_rows(self, query: str, *args) -> AsyncIterator[asyncpg.Record]:
+        """Stream query results through a server-side cursor instead of fetching them all at once"""
+        async with self.connection_pool.acquire() as conn:
+            # Cursors only live inside a transaction; conn.cursor() goes through the
+            # connection's statement cache, so repeated queries skip Parse/plan
+            async with conn.transaction():
+                async for row in conn.cursor(query, *args, prefetch=_CURSOR_PREFETCH):
+                    yield row
+    
+    async def extract_slides_from_source(
+        self,
+        source_id: str,
+        file_path: str,
+        industry: str = None,
+        include_images: bool = True,
+        include_formatting: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Extract slides from a presentation file and store them in the database.
+        
+        Text-only ingestion can pass include_images=False / include_formatting=False to
+        skip image encoding/upload and run-level formatting capture.
+        """
         temp_file = None
         try:
             # Handle S3 files
@@ -162,17 +362,10 @@ class ControlledSourceManager:
             else:
                 presentation_path = file_path
             
-            # Load the presentation
-            prs = Presentation(presentation_path)
-            slides = []
-            
-            for i, slide in enumerate(prs.slides):
-                slide_data = self._extract_slide_data(slide, i)
-                slide_data['source_id'] = source_id
-                slides.append(slide_data)
-            
-            # Store slides in database with industry information
-            await self._store_slides(slides, industry)
+            # Parse and store concurrently: batches are inserted while later slides are still parsing
+            slides = await self._extract_and_store_pipelined(
+                source_id, presentation_path, industry, include_images, include_formatting
+            )
             
             logger.info(f"Extracted {len(slides)} slides from source {source_id} for industry {industry}")
             return slides
@@ -181,24 +374,264 @@ class ControlledSourceManager:
             logger.error(f"Error extracting slides from source {source_id}: {e}")
             return []
         finally:
-            # Clean up temporary file
-            if temp_file and os.path.exists(temp_file):
+            # Clean up temporary file (in-memory downloads need no cleanup)
+            if isinstance(temp_file, str) and os.path.exists(temp_file):
                 try:
                     os.unlink(temp_file)
                 except Exception as e:
                     logger.warning(f"Failed to clean up temp file {temp_file}: {e}")
     
-    async def _download_s3_file(self, s3_path: str) -> Optional[str]:
-        """Download file from S3 to temporary location"""
+    async def extract_many(
+        self,
+        jobs: List[Tuple[str, str]],
+        industry: str = None,
+        include_images: bool = True,
+        include_formatting: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Extract slides from many (source_id, file_path) jobs in parallel and store them in one batch"""
+        temp_files = []
+        try:
+            # Resolve S3 files to local paths before handing off to worker processes;
+            # downloads run concurrently on the S3 thread pool
+            s3_jobs = [(source_id, file_path) for source_id, file_path in jobs if file_path.startswith('s3://')]
+            downloaded = await asyncio.gather(*[self._download_s3_file(file_path) for _, file_path in s3_jobs])
+            local_paths = {}
+            for (source_id, file_path), temp_file in zip(s3_jobs, downloaded):
+                if not temp_file:
+                    logger.error(f"Failed to download S3 file: {file_path}")
+                    continue
+                if isinstance(temp_file, io.BytesIO):
+                    # Worker processes receive in-memory downloads as bytes
+                    local_paths[(source_id, file_path)] = temp_file.getvalue()
+                else:
+                    temp_files.append(temp_file)
+                    local_paths[(source_id, file_path)] = temp_file
+            
+            parse_jobs = []
+            for source_id, file_path in jobs:
+                if not file_path.startswith('s3://'):
+                    parse_jobs.append((source_id, file_path))
+                elif (source_id, file_path) in local_paths:
+                    parse_jobs.append((source_id, local_paths[(source_id, file_path)]))
+            
+            if not parse_jobs:
+                return []
+            
+            # python-pptx parsing is CPU-bound, so fan out across processes
+            loop = asyncio.get_running_loop()
+            pool = self._get_process_pool()
+            results = await asyncio.gather(
+                *[
+                    loop.run_in_executor(pool, _parse_pptx_worker, source_id, path, 0, None, include_images, include_formatting)
+                    for source_id, path in parse_jobs
+                ],
+                return_exceptions=True
+            )
+            
+            slides = []
+            for (source_id, _), result in zip(parse_jobs, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error extracting slides from source {source_id}: {result}")
+                    continue
+                source_slides, pending_blobs = result
+                # Each deck's images are resolved with its own digest map
+                await loop.run_in_executor(None, self._attach_image_blobs, pending_blobs, {})
+                slides.extend(source_slides)
+            
+            # Store all slides with a single bulk insert
+            await self._store_slides(slides, industry)
+            
+            logger.info(f"Extracted {len(slides)} slides from {len(parse_jobs)} sources for industry {industry}")
+            return slides
+            
+        except Exception as e:
+            logger.error(f"Error extracting slides from sources: {e}")
+            return []
+        finally:
+            # Clean up temporary files
+            for temp_file in temp_files:
+                if os.path.exists(temp_file):
+                    try:
+                        os.unlink(temp_file)
+                    except Exception as e:
+                        logger.warning(f"Failed to clean up temp file {temp_file}: {e}")
+    
+    async def _extract_and_store_pipelined(
+        self,
+        source_id: str,
+        presentation_path: Union[str, io.BytesIO],
+        industry: str = None,
+        include_images: bool = True,
+        include_formatting: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Run slide parsing (producer) and batched inserts (consumer) concurrently through a bounded queue.
+        
+        All batches go in one transaction, so a parse or insert failure part-way through
+        the deck rolls back the slides already written for the source.
+        """
+        queue = asyncio.Queue(maxsize=_PIPELINE_QUEUE_DEPTH)
+        slides = []
+        # One digest map for the whole deck so a repeated logo is resolved once, not once per batch
+        seen_images: Dict[bytes, Dict[str, Any]] = {}
+        
+        async def produce():
+            try:
+                async for batch in self._iter_slide_batches(
+                    source_id, presentation_path, seen_images=seen_images,
+                    include_images=include_images, include_formatting=include_formatting
+                ):
+                    await queue.put(batch)
+            except Exception as e:
+                # Hand the failure to the consumer so it rolls back instead of committing a partial deck.
+                # Cancellation isn't caught: the consumer has failed by then and the queue may be full
+                await queue.put(e)
+            else:
+                await queue.put(None)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            async with self.connection_pool.acquire() as conn:
+                async with conn.transaction():
+                    while (batch := await queue.get()) is not None:
+                        if isinstance(batch, Exception):
+                            raise batch
+                        await self._insert_slides(conn, batch, industry)
+                        slides.extend(batch)
+        except BaseException:
+            producer.cancel()
+            raise
+        finally:
+            self._invalidate_cache()
+        
+        return slides
+    
+    async def _iter_slide_batches(
+        self,
+        source_id: str,
+        presentation_path: Union[str, io.BytesIO],
+        batch_size: int = _SLIDE_BATCH_SIZE,
+        seen_images: Optional[Dict[bytes, Dict[str, Any]]] = None,
+        include_images: bool = True,
+        include_formatting: bool = True
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Parse a presentation, yielding slide dicts in order in batches extracted in parallel worker processes.
+        
+        Image blobs are resolved here against seen_images rather than in the workers,
+        so repeated images are uploaded/encoded once per deck.
+        """
+        if seen_images is None:
+            seen_images = {}
+        loop = asyncio.get_running_loop()
+        # Only presentation.xml is needed to plan the split; the full deck is parsed
+        # off the event loop by whichever thread/worker extracts it
+        slide_count = await loop.run_in_executor(None, _count_pptx_slides, presentation_path)
+        
+        # Split the deck into one slide range per core (bounded by the pipeline batch size)
+        workers = os.cpu_count() or 1
+        range_size = max(_MIN_SLIDES_PER_WORKER, min(batch_size, -(-slide_count // workers)))
+        
+        if slide_count <= range_size:
+            # Not worth a process hop: parse and extract in a thread
+            slides, pending_blobs = await loop.run_in_executor(
+                None, self._parse_presentation, source_id, presentation_path, 0, None, include_images, include_formatting
+            )
+            await loop.run_in_executor(None, self._attach_image_blobs, pending_blobs, seen_images)
+            yield slides
+            return
+        
+        # python-pptx objects don't pickle, so each worker re-opens the file and extracts its index range
+        # (in-memory downloads are shipped to the workers as bytes)
+        if isinstance(presentation_path, io.BytesIO):
+            presentation_path = presentation_path.getvalue()
+        pool = self._get_process_pool()
+        futures = [
+            loop.run_in_executor(
+                pool, _parse_pptx_worker, source_id, presentation_path,
+                start, min(start + range_size, slide_count), include_images, include_formatting
+            )
+            for start in range(0, slide_count, range_size)
+        ]
+        try:
+            # Await in submission order so slides keep their index order
+            for future in futures:
+                slides, pending_blobs = await future
+                await loop.run_in_executor(None, self._attach_image_blobs, pending_blobs, seen_images)
+                yield slides
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def _parse_presentation(
+        self,
+        source_id: str,
+        presentation_path: Union[str, bytes, io.BytesIO],
+        start: int = 0,
+        stop: Optional[int] = None,
+        include_images: bool = True,
+        include_formatting: bool = True
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], bytes]]]:
+        """Parse slides [start:stop] of a presentation file (path, in-memory buffer or raw bytes) into slide dicts"""
+        if isinstance(presentation_path, bytes):
+            presentation_path = io.BytesIO(presentation_path)
+        prs = Presentation(presentation_path)
+        pptx_slides = list(prs.slides)[start:stop]
+        return self._extract_slide_batch(source_id, pptx_slides, start, include_images, include_formatting)
+    
+    def _extract_slide_batch(
+        self,
+        source_id: str,
+        pptx_slides,
+        start_index: int,
+        include_images: bool = True,
+        include_formatting: bool = True
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], bytes]]]:
+        """Extract slide dicts for a run of slides, numbering them from start_index.
+        
+        Image blobs come back unresolved alongside the slides so the caller can pass them
+        to _attach_image_blobs with one digest map for the whole deck. The pending entries
+        reference the slides' image dicts, and a worker's result is pickled as one object,
+        so that sharing survives the trip back from a worker process.
+        """
+        slides = []
+        pending_blobs = []
+        # A corrupt deck tends to fail the same way on every slide; only the first of each error type is logged loudly
+        logged_errors = set()
+        
+        for i, slide in enumerate(pptx_slides, start_index):
+            slide_data = self._extract_slide_data(slide, i, pending_blobs, include_images, include_formatting, logged_errors)
+            slide_data['source_id'] = source_id
+            slides.append(slide_data)
+        
+        return slides, pending_blobs
+    
+    async def _download_s3_file(self, s3_path: str) -> Optional[Union[str, io.BytesIO]]:
+        """Download file from S3 into memory, or to a temporary location when it is too large"""
         if not self.s3_client:
             logger.error("S3 client not initialized")
             return None
         
+        temp_path = None
         try:
             # Parse S3 URL
             parsed = urlparse(s3_path)
             bucket = parsed.netloc
             key = parsed.path.lstrip('/')
+            loop = asyncio.get_running_loop()
+            
+            # Most decks fit in RAM: skip the temp file write/read round-trip
+            head = await loop.run_in_executor(
+                self._s3_pool,
+                lambda: self.s3_client.head_object(Bucket=bucket, Key=key)
+            )
+            if head.get('ContentLength', 0) <= _INMEMORY_DOWNLOAD_MAX:
+                logger.info(f"Downloading S3 file into memory: s3://{bucket}/{key}")
+                buffer = io.BytesIO()
+                await loop.run_in_executor(
+                    self._s3_pool,
+                    lambda: self.s3_client.download_fileobj(bucket, key, buffer, Config=self.transfer_config)
+                )
+                buffer.seek(0)
+                return buffer
             
             # Create temporary file
             temp_fd, temp_path = tempfile.mkstemp(suffix='.pptx')
@@ -206,17 +639,33 @@ class ControlledSourceManager:
             
             # Download file from S3
             logger.info(f"Downloading S3 file: s3://{bucket}/{key}")
-            self.s3_client.download_file(bucket, key, temp_path)
+            await loop.run_in_executor(
+                self._s3_pool,
+                lambda: self.s3_client.download_file(bucket, key, temp_path, Config=self.transfer_config)
+            )
             
             logger.info(f"Successfully downloaded S3 file to: {temp_path}")
             return temp_path
             
         except Exception as e:
             logger.error(f"Error downloading S3 file {s3_path}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
             return None
     
-    def _extract_slide_data(self, slide, index: int) -> Dict[str, Any]:
-        """Extract data from a single slide with enhanced visual element preservation"""
+    def _extract_slide_data(
+        self,
+        slide,
+        index: int,
+        pending_blobs: List[Tuple[Dict[str, Any], bytes]],
+        include_images: bool = True,
+        include_formatting: bool = True,
+        logged_errors: Optional[set] = None
+    ) -> Dict[str, Any]:
+        """Extract data from a single slide with enhanced visual element preservation.
+        
+        Image blobs are queued on pending_blobs; the caller resolves them with _attach_image_blobs.
+        """
         slide_data = {
             'slide_index': index,
             'title': '',
@@ -229,47 +678,72 @@ class ControlledSourceManager:
             'layout_info': {}  # Store layout information
         }
         
+        # Single pass over the shapes: collect images, text content and formatting together
+        content_parts = []
+        images = []
+        shapes_count = 0
+        text_shapes = 0
+        
+        # Only the shape-tree walk can fail on a malformed slide; everything after it guards itself
         try:
-            # Extract title
-            if slide.shapes.title:
-                slide_data['title'] = slide.shapes.title.text
-                # Extract title formatting
-                slide_data['formatting']['title'] = self._extract_text_formatting(slide.shapes.title)
-            
-            # Extract content from text boxes with formatting
-            content_parts = []
-            for shape in slide.shapes:
-                if hasattr(shape, 'text') and shape.text:
-                    if shape != slide.shapes.title:  # Don't duplicate title
-                        content_parts.append(shape.text)
-                        # Extract formatting for each text shape
-                        shape_formatting = self._extract_text_formatting(shape)
-                        if shape_formatting:
-                            slide_data['formatting'][f'text_shape_{len(content_parts)}'] = shape_formatting
-            
-            slide_data['content'] = '\n'.join(content_parts)
-            
-            # Extract images and visual elements
-            slide_data['images'] = self._extract_images(slide)
+            shapes = slide.shapes
             
-            # Extract slide background and layout information
-            slide_data['layout_info'] = self._extract_layout_info(slide)
-            
-            # Determine slide type
-            slide_data['slide_type'] = self._classify_slide_type(slide_data)
-            
-            # Enhanced metadata
-            slide_data['metadata'] = {
-                'shapes_count': len(slide.shapes),
-                'has_images': len(slide_data['images']) > 0,
-                'image_count': len(slide_data['images']),
-                'text_shapes': len([s for s in slide.shapes if hasattr(s, 'text')]),
-                'has_background': hasattr(slide.background, 'fill'),
-                'slide_layout': getattr(slide.slide_layout, 'name', 'unknown') if hasattr(slide, 'slide_layout') else 'unknown'
-            }
+            # Extract title (shapes.title scans the shape tree, so look it up once)
+            title_shape = shapes.title
+            if title_shape:
+                slide_data['title'] = title_shape.text
+                # Extract title formatting
+                if include_formatting:
+                    slide_data['formatting']['title'] = self._extract_text_formatting(title_shape)
             
+            for i, shape in enumerate(shapes):
+                shapes_count += 1
+                if hasattr(shape, 'image'):
+                    if include_images:
+                        image_data = self._extract_image(shape, i, pending_blobs)
+                        if image_data:
+                            images.append(image_data)
+                    continue
+                # shape.text re-walks the <a:t> runs on every access, so read it once
+                text = getattr(shape, 'text', None)
+                if text is not None:
+                    text_shapes += 1
+                    if text and shape != title_shape:  # Don't duplicate title
+                        content_parts.append(text)
+                        # Extract formatting for each text shape
+                        if include_formatting:
+                            shape_formatting = self._extract_text_formatting(shape)
+                            if shape_formatting:
+                                slide_data['formatting'][f'text_shape_{len(content_parts)}'] = shape_formatting
         except Exception as e:
-            logger.error(f"Error extracting slide data: {e}")
+            error_type = type(e).__name__
+            if logged_errors is None or error_type not in logged_errors:
+                if logged_errors is not None:
+                    logged_errors.add(error_type)
+                logger.error("Error extracting slide %d data: %s", index, e)
+            else:
+                logger.debug("Error extracting slide %d data: %s", index, e)
+        
+        slide_data['content'] = '\n'.join(content_parts)
+        slide_data['images'] = images
+        
+        # Extract slide background and layout information
+        layout_info = self._extract_layout_info(slide)
+        slide_data['layout_info'] = layout_info
+        
+        # Determine slide type
+        slide_data['slide_type'] = self._classify_slide_type(slide_data)
+        
+        # Enhanced metadata
+        slide_data['metadata'] = {
+            'shapes_count': shapes_count,
+            'has_images': len(slide_data['images']) > 0,
+            'image_count': len(slide_data['images']),
+            'text_shapes': text_shapes,
+            # Reuse the guarded layout lookup rather than touching slide.background/slide_layout again
+            'has_background': layout_info.get('background', {}).get('has_fill', False),
+            'slide_layout': layout_info.get('layout', {}).get('name', 'unknown')
+        }
         
         return slide_data
     
@@ -319,61 +793,134 @@ class ControlledSourceManager:
         
         return formatting
     
-    def _extract_images(self, slide) -> List[Dict[str, Any]]:
-        """Extract images from slide including GIFs and other formats"""
-        images = []
+    def _extract_image(self, shape, index: int, pending_blobs: List[Tuple[Dict[str, Any], bytes]]) -> Optional[Dict[str, Any]]:
+        """Extract a picture shape (including GIFs); its blob is queued on pending_blobs for _attach_image_blobs"""
+        try:
+            # shape.image builds a new Image object on each access, so grab it once
+            image = shape.image
+            image_blob = getattr(image, 'blob', None)
+            
+            # Determine image format
+            content_type = getattr(image, 'content_type', 'unknown')
+            
+            # Check if it's a GIF
+            is_gif = False
+            if content_type and 'gif' in content_type.lower():
+                is_gif = True
+            elif image_blob and image_blob.startswith(b'GIF'):
+                is_gif = True
+                content_type = 'image/gif'
+            
+            image_data = {
+                'index': index,
+                'left': shape.left,
+                'top': shape.top,
+                'width': shape.width,
+                'height': shape.height,
+                'image_format': content_type,
+                'is_gif': is_gif,
+                'image_data': None
+                # Note: Removed image_blob to avoid JSON serialization issues
+                # Raw blob data is not needed for database storage
+            }
+            if image_blob:
+                pending_blobs.append((image_data, image_blob))
+            
+            # Try to extract image filename or identifier
+            if hasattr(image, 'filename'):
+                image_data['filename'] = image.filename
+            
+            # Log the image type
+            if is_gif:
+                logger.info(f"Extracted GIF image: {image_data.get('filename', f'image_{index}')}")
+            else:
+                logger.info(f"Extracted image: {image_data.get('filename', f'image_{index}')} ({content_type})")
+            
+            return image_data
+            
+        except Exception as e:
+            logger.warning(f"Could not extract image {index}: {e}")
+            return None
+    
+    def _attach_image_blobs(self, pending_blobs: List[Tuple[Dict[str, Any], bytes]], seen_images: Optional[Dict[bytes, Dict[str, Any]]] = None):
+        """Reference image blobs by S3 key when an image bucket is configured, otherwise inline them as base64.
+        
+        seen_images maps a blob digest to its resolved fields so repeated images in a
+        presentation are uploaded/encoded only once.
+        """
+        if seen_images is None:
+            seen_images = {}
+        
+        digests = [hashlib.blake2b(image_blob, digest_size=16).digest() for _, image_blob in pending_blobs]
+        new_blobs = {}
+        for (image_data, image_blob), digest in zip(pending_blobs, digests):
+            if digest not in seen_images and digest not in new_blobs:
+                new_blobs[digest] = (image_blob, image_data['image_format'])
+        
+        refs = [None] * len(new_blobs)
+        if self.image_bucket and self.s3_client and new_blobs:
+            # Upload the new images concurrently
+            refs = list(self._s3_pool.map(
+                lambda item: self._store_image_blob(*item),
+                new_blobs.values()
+            ))
+        
+        for (digest, (image_blob, _)), ref in zip(new_blobs.items(), refs):
+            seen_images[digest] = ref or {'image_data': pybase64.b64encode(image_blob).decode('ascii')}
+        
+        for (image_data, _), digest in zip(pending_blobs, digests):
+            image_data.update(seen_images[digest])
+    
+    def _store_image_blob(self, image_blob: bytes, content_type: str) -> Optional[Dict[str, str]]:
+        """Upload an image blob under a content-addressed key so identical images are stored once"""
+        digest = hashlib.sha256(image_blob).hexdigest()
+        key = f"slide-images/{digest[:2]}/{digest}"
         
         try:
-            for i, shape in enumerate(slide.shapes):
-                if hasattr(shape, 'image'):
-                    try:
-                        # Get image data
-                        image_blob = shape.image.blob if hasattr(shape.image, 'blob') else None
-                        
-                        # Determine image format
-                        content_type = shape.image.content_type if hasattr(shape.image, 'content_type') else 'unknown'
-                        
-                        # Check if it's a GIF
-                        is_gif = False
-                        if content_type and 'gif' in content_type.lower():
-                            is_gif = True
-                        elif image_blob and image_blob.startswith(b'GIF'):
-                            is_gif = True
-                            content_type = 'image/gif'
-                        
-                        image_data = {
-                            'index': i,
-                            'left': shape.left,
-                            'top': shape.top,
-                            'width': shape.width,
-                            'height': shape.height,
-                            'image_format': content_type,
-                            'is_gif': is_gif,
-                            'image_data': base64.b64encode(image_blob).decode('utf-8') if image_blob else None
-                            # Note: Removed image_blob to avoid JSON serialization issues
-                            # Raw blob data is not needed for database storage
-                        }
-                        
-                        # Try to extract image filename or identifier
-                        if hasattr(shape.image, 'filename'):
-                            image_data['filename'] = shape.image.filename
-                        
-                        # Log the image type
-                        if is_gif:
-                            logger.info(f"Extracted GIF image: {image_data.get('filename', f'image_{i}')}")
-                        else:
-                            logger.info(f"Extracted image: {image_data.get('filename', f'image_{i}')} ({content_type})")
-                        
-                        images.append(image_data)
-                        
-                    except Exception as e:
-                        logger.warning(f"Could not extract image {i}: {e}")
-                        continue
-                        
+            self.s3_client.put_object(
+                Bucket=self.image_bucket,
+                Key=key,
+                Body=image_blob,
+                ContentType=content_type,
+                IfNoneMatch='*'
+            )
+        except ClientError as e:
+            # 412 means an identical image was already uploaded
+            if e.response.get('Error', {}).get('Code') not in ('PreconditionFailed', '412'):
+                logger.warning(f"Could not upload slide image {key}: {e}")
+                return None
         except Exception as e:
-            logger.warning(f"Could not extract images from slide: {e}")
+            logger.warning(f"Could not upload slide image {key}: {e}")
+            return None
+        
+        return {'s3_key': key, 'sha256': digest}
+    
+    async def load_slide_images(self, slides: List[Dict[str, Any]]):
+        """Fetch S3-stored image blobs for the given slides in place (sets image_blob) before rendering"""
+        pending = {}
+        for slide in slides:
+            for image in slide.get('images') or []:
+                if isinstance(image, dict) and image.get('s3_key') and not (image.get('image_data') or image.get('image_blob')):
+                    pending.setdefault(image['s3_key'], []).append(image)
         
-        return images
+        if not pending or not self.s3_client:
+            return
+        
+        def fetch(key: str) -> Optional[bytes]:
+            try:
+                return self.s3_client.get_object(Bucket=self.image_bucket, Key=key)['Body'].read()
+            except Exception as e:
+                logger.warning(f"Could not fetch slide image {key}: {e}")
+                return None
+        
+        loop = asyncio.get_running_loop()
+        keys = list(pending)
+        blobs = await asyncio.gather(*[loop.run_in_executor(self._s3_pool, fetch, key) for key in keys])
+        
+        for key, blob in zip(keys, blobs):
+            if blob:
+                for image in pending[key]:
+                    image['image_blob'] = blob
     
     def _extract_layout_info(self, slide) -> Dict[str, Any]:
         """Extract layout and background information"""
@@ -407,49 +954,83 @@ class ControlledSourceManager:
         return layout_info
     
     def _classify_slide_type(self, slide_data: Dict[str, Any]) -> str:
-        """Classify the type of slide based on content"""
-        title = slide_data.get('title', '').lower()
-        content = slide_data.get('content', '').lower()
+        """Classify the type of slide based on content (fallback for the stored slide_type_auto column)"""
+        title = (slide_data.get('title') or '').lower()
+        content = (slide_data.get('content') or '').lower()
         
-        if any(word in title for word in ['title', 'agenda', 'overview']):
+        if _TITLE_TYPE_RE.search(title):
             return 'title'
-        elif any(word in content for word in ['chart', 'graph', 'data', 'statistics']):
-            return 'chart'
-        elif any(word in content for word in ['quote', 'testimonial', 'feedback']):
-            return 'quote'
-        elif any(word in content for word in ['conclusion', 'summary', 'next steps']):
-            return 'conclusion'
-        else:
-            return 'content'
+        
+        # One regex pass over the content; a chart keyword wins outright, so stop there
+        found = set()
+        for match in _CONTENT_TYPE_RE.finditer(content):
+            if match.lastgroup == 'chart':
+                return 'chart'
+            found.add(match.lastgroup)
+        
+        for slide_type in _CONTENT_TYPE_PRIORITY:
+            if slide_type in found:
+                return slide_type
+        return 'content'
     
     async def _store_slides(self, slides: List[Dict[str, Any]], industry: str = None):
         """Store extracted slides in the database with enhanced visual data"""
         try:
+            if not slides:
+                return
+            
+            # Insert in bounded chunks, each in its own transaction, so huge decks
+            # don't hold locks or buffer every record at once
+            chunk_size = self.slide_insert_chunk
             async with self.connection_pool.acquire() as conn:
-                for slide in slides:
-                    await conn.execute("""
-                        INSERT INTO source_slides (
-                            source_id, slide_index, title, content, 
-                            image_url, slide_type, metadata, 
-                            images, formatting, layout_info, industry
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-                    """, 
-                    slide['source_id'],
-                    slide['slide_index'],
-                    slide['title'],
-                    slide['content'],
-                    slide['image_url'],
-                    slide['slide_type'],
-                    json.dumps(slide['metadata']),
-                    json.dumps(slide.get('images', [])),
-                    json.dumps(slide.get('formatting', {})),
-                    json.dumps(slide.get('layout_info', {})),
-                    industry
-                    )
+                for start in range(0, len(slides), chunk_size):
+                    async with conn.transaction():
+                        await self._insert_slides(conn, slides[start:start + chunk_size], industry)
+            
+            self._invalidate_cache()
         except Exception as e:
             logger.error(f"Error storing slides: {e}")
             raise e
     
+    async def _insert_slides(self, conn, slides: List[Dict[str, Any]], industry: str = None):
+        """Insert a batch of slides in one round-trip (executemany for small batches, COPY for large ones)"""
+        records = [
+            (
+                slide['source_id'],
+                slide['slide_index'],
+                slide['title'],
+                slide['content'],
+                slide['image_url'],
+                slide['slide_type'],
+                slide['metadata'],
+                slide.get('images', []),
+                slide.get('formatting', {}),
+                slide.get('layout_info', {}),
+                industry
+            )
+            for slide in slides
+        ]
+        
+        if len(records) > _COPY_THRESHOLD:
+            await conn.copy_records_to_table(
+                'source_slides',
+                records=records,
+                columns=[
+                    'source_id', 'slide_index', 'title', 'content',
+                    'image_url', 'slide_type', 'metadata',
+                    'images', 'formatting', 'layout_info', 'industry'
+                ]
+            )
+        else:
+            # COPY has fixed setup overhead; a pipelined executemany is cheaper for small decks
+            await conn.executemany("""
+                INSERT INTO source_slides (
+                    source_id, slide_index, title, content, 
+                    image_url, slide_type, metadata, 
+                    images, formatting, layout_info, industry
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+            """, records)
+    
     async def store_presentation_source(
         self, 
         source_id: str, 
@@ -480,15 +1061,57 @@ class ControlledSourceManager:
                 """, 
                 source_id, title, description, industry, tags, 
                 file_path, 'uploaded', 'approved', None,
-                json.dumps({'mime_type': mime_type})
+                {'mime_type': mime_type}
                 )
                 
+                self._invalidate_cache()
                 logger.info(f"Stored presentation source: {source_id} for industry: {industry}")
                 
         except Exception as e:
             logger.error(f"Error storing presentation source: {e}")
             raise e
 
+    async def iter_slides_by_criteria(
+        self, 
+        industry: str, 
+        use_case: str, 
+        customer: str,
+        target_audience: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream relevant slides from approved sources based on criteria"""
+        # Each criterion must match the slide text (full-text, GIN-indexed search_tsv)
+        # or its source title/description (trigram-indexed ILIKE), in any order
+        search_terms = [term for term in (use_case, customer, target_audience) if term]
+        term_conditions = [
+            f"""(
+                    ss.search_tsv @@ plainto_tsquery('english', ${i}) OR
+                    ps.title ILIKE ${i + 1} OR
+                    ps.description ILIKE ${i + 1}
+                )"""
+            for i in range(2, 2 * len(search_terms) + 2, 2)
+        ]
+        term_clause = " AND ".join(term_conditions) if term_conditions else "TRUE"
+        
+        # Single round-trip: filter approved sources in the same query
+        query = f"""
+            SELECT {_SLIDE_COLUMNS},
+                   ps.title as source_title, ps.description as source_description
+            FROM source_slides ss
+            JOIN presentation_sources ps ON ss.source_id = ps.id
+            WHERE ps.status = 'approved'
+            AND ps.industry = $1
+            AND {term_clause}
+            ORDER BY ps.relevance_score DESC, ss.slide_index
+        """
+        
+        # Each term binds twice: raw text for plainto_tsquery and a %term% pattern for ILIKE
+        params = []
+        for term in search_terms:
+            params.extend([term, f"%{term}%"])
+        
+        async for row in self._iter_rows(query, industry, *params):
+            yield dict(row)
+    
     async def search_slides_by_criteria(
         self, 
         industry: str, 
@@ -498,42 +1121,15 @@ class ControlledSourceManager:
     ) -> List[Dict[str, Any]]:
         """Search for relevant slides from approved sources based on criteria"""
         try:
-            async with self.connection_pool.acquire() as conn:
-                # First get approved sources for the industry
-                sources = await conn.fetch("""
-                    SELECT id FROM presentation_sources 
-                    WHERE status = 'approved' AND industry = $1
-                """, industry)
-                
-                if not sources:
-                    logger.warning(f"No approved sources found for industry: {industry}")
-                    return []
-                
-                source_ids = [row['id'] for row in sources]
-                
-                # Search for relevant slides
-                query = f"""
-                    SELECT ss.*, ps.title as source_title, ps.description as source_description
-                    FROM source_slides ss
-                    JOIN presentation_sources ps ON ss.source_id = ps.id
-                    WHERE ss.source_id = ANY($1)
-                    AND (
-                        ss.title ILIKE $2 OR 
-                        ss.content ILIKE $2 OR
-                        ps.title ILIKE $2 OR
-                        ps.description ILIKE $2
-                    )
-                    ORDER BY ps.relevance_score DESC, ss.slide_index
-                """
-                
-                search_term = f"%{use_case}%{customer}%"
-                if target_audience:
-                    search_term += f"%{target_audience}%"
-                
-                rows = await conn.fetch(query, source_ids, search_term)
-                
-                return [dict(row) for row in rows]
-                
+            slides = [
+                slide async for slide in self.iter_slides_by_criteria(industry, use_case, customer, target_audience)
+            ]
+            
+            if not slides:
+                logger.warning(f"No matching slides found for industry: {industry}")
+            
+            return slides
+            
         except Exception as e:
             logger.error(f"Error searching slides: {e}")
             return []
@@ -541,6 +1137,12 @@ class ControlledSourceManager:
     async def get_source_statistics(self) -> Dict[str, Any]:
         """Get statistics about approved sources"""
         try:
+            # Callers get their own copy so they can't alter the cached result
+            cache_key = ('source_statistics',)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
             async with self.connection_pool.acquire() as conn:
                 # Get overall stats
                 stats = await conn.fetchrow("""
@@ -566,10 +1168,11 @@ class ControlledSourceManager:
                     ORDER BY slide_count DESC
                 """)
                 
-                return {
+                statistics = self._cache_set(cache_key, {
                     'overview': dict(stats),
                     'industry_breakdown': [dict(row) for row in industry_stats]
-                }
+                })
+                return copy.deepcopy(statistics)
                 
         except Exception as e:
             logger.error(f"Error getting source statistics: {e}")
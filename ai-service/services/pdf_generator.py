@@ -1,5 +1,5 @@
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Image, Table, TableStyle
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, PageBreak, Image, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, blue, green, red, orange, purple
@@ -9,515 +9,956 @@ from reportlab.lib import colors
 from reportlab.graphics.shapes import Drawing, Rect, String
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.lib.fonts import ps2tt
+from reportlab import rl_config
 import os
+import re
 import uuid
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+import asyncio
+import tempfile
+import shutil
+import hashlib
+import copy
+import json
+import threading
+import aiohttp
+import boto3
+from botocore.config import Config
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union, BinaryIO, Tuple, Awaitable
 import logging
-from PIL import Image as PILImage
-import requests
-from io import BytesIO
+from functools import lru_cache
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from xml.sax.saxutils import escape
+from pypdf import PdfWriter
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional directory of TrueType fonts (e.g. fonts used in uploaded decks), each registered under its file name
+PDF_FONT_DIR = os.getenv('PDF_FONT_DIR')
+
+def _register_fonts():
+    """Register the fonts in PDF_FONT_DIR once per process, at import, rather than per build"""
+    if not PDF_FONT_DIR or not os.path.isdir(PDF_FONT_DIR):
+        return
+    for name in sorted(os.listdir(PDF_FONT_DIR)):
+        font_name, ext = os.path.splitext(name)
+        if ext.lower() == '.ttf':
+            try:
+                pdfmetrics.registerFont(TTFont(font_name, os.path.join(PDF_FONT_DIR, name)))
+            except Exception as e:
+                logger.warning("Could not register font %s: %s", name, e)
+
+_register_fonts()
+
+@lru_cache(maxsize=64)
+def _resolve_font(font_name: str) -> str:
+    """The font if ReportLab can lay it out, otherwise Helvetica; unknown names search font paths only once"""
+    try:
+        pdfmetrics.getFont(font_name)
+        ps2tt(font_name)
+        return font_name
+    except Exception:
+        return 'Helvetica'
+
+# Decks with at least this many slides build their flowables across worker processes
+PARALLEL_SLIDE_THRESHOLD = int(os.getenv('PDF_PARALLEL_SLIDE_THRESHOLD', 24))
+
+_slide_pool = None
+
+# ReportLab builds are synchronous; they run here so generate_presentation doesn't block the event loop
+_PDF_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='pdf-build')
+
+def _disable_shape_checking():
+    """Turn off ReportLab's attribute validation on every graphics assignment (a development aid)
+    
+    Called from the build path and as the worker initializer rather than at import, so importing
+    this module doesn't change ReportLab settings for the rest of the process.
+    """
+    rl_config.shapeChecking = 0
+
+def _get_slide_pool() -> ProcessPoolExecutor:
+    """Shared process pool for PDF builds and slide flowables (created on first use)"""
+    global _slide_pool
+    if _slide_pool is None:
+        _slide_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_disable_shape_checking)
+    return _slide_pool
+
+class _BarChartDrawing(Drawing):
+    """Bar chart drawing that pickles as its data (chart axes hold unpicklable property classes)"""
+    
+    def __init__(self, years: List, values: List):
+        super().__init__(400, 200)
+        self._chart_args = (years, values)
+        
+        # Create bar chart
+        chart = VerticalBarChart()
+        chart.x = 50
+        chart.y = 50
+        chart.height = 150
+        chart.width = 300
+        chart.data = [values]
+        chart.categoryAxis.categoryNames = years
+        chart.categoryAxis.labels.fontSize = 10
+        chart.valueAxis.valueMin = 0
+        chart.valueAxis.valueMax = max(values) * 1.1
+        
+        # Add chart to drawing
+        self.add(chart)
+    
+    def __reduce__(self):
+        # Rebuilt from its data when shipped back from a flowable worker
+        return (_BarChartDrawing, self._chart_args)
+    
+    def __copy__(self):
+        # Shares the built chart; copy.copy would otherwise go through __reduce__ and rebuild it
+        clone = _BarChartDrawing.__new__(_BarChartDrawing)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+# Style of the data table shown when a chart can't be drawn (setStyle only reads it, so one is shared)
+_FALLBACK_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 14),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+@lru_cache(maxsize=256)
+def _bar_chart_drawing(items: Tuple[Tuple[Any, Any], ...]) -> _BarChartDrawing:
+    """Bar chart for (category, value) pairs, built once per distinct dataset"""
+    return _BarChartDrawing([key for key, _ in items], [value for _, value in items])
+
+# Preview thumbnails: first pages of each PDF, bounded to this size
+PREVIEW_PAGES = int(os.getenv('PDF_PREVIEW_PAGES', 3))
+PREVIEW_SIZE = (256, 256)
+# Poppler's full-page renders are read once and discarded, so keep them on tmpfs when the host has one
+PREVIEW_SCRATCH_DIR = os.getenv('PREVIEW_SCRATCH_DIR') or ('/dev/shm' if os.access('/dev/shm', os.W_OK) else None)
+
+# Previews are uploaded here when set (otherwise their local paths are returned)
+PREVIEW_BUCKET = os.getenv('PREVIEW_IMAGE_BUCKET')
+PREVIEW_UPLOAD_CONCURRENCY = 16
+# Uploaded previews are stored as s3:// references and presigned for this long each time they are listed
+PREVIEW_URL_TTL = int(os.getenv('PREVIEW_URL_TTL', 3600))
+_preview_upload_pool = ThreadPoolExecutor(max_workers=PREVIEW_UPLOAD_CONCURRENCY, thread_name_prefix='preview-upload')
+
+# Runs of characters not safe in output filenames (customer names go into the PDF filename)
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w.-]+')
+
+# Stored run colors of the form "RGBColor(r, g, b)"
+_RGB_RE = re.compile(r'RGBColor\((\d+),\s*(\d+),\s*(\d+)\)')
+
+# Stored paragraph alignment strings -> ReportLab alignment
+ALIGNMENT_MAP = {
+    'PP_ALIGN.LEFT': TA_LEFT,
+    'PP_ALIGN.CENTER': TA_CENTER,
+    'PP_ALIGN.RIGHT': TA_RIGHT,
+    'PP_ALIGN.JUSTIFY': TA_LEFT  # ReportLab doesn't have justify
+}
+
+# Non-blank content lines, matched from their first non-space character
+_LINE_RE = re.compile(r'\S[^\n]*')
+
+# Bullet markup for content lines (each line after the first starts with a line break)
+_BULLET = "• "
+_BULLET_BREAK = "<br/>" + _BULLET
+
+# A4 page margins (points) shared by every presentation
+PAGE_MARGINS = {'leftMargin': 72, 'rightMargin': 72, 'topMargin': 72, 'bottomMargin': 18}
+
+_thread_templates = threading.local()
+
+def _page_templates() -> List[PageTemplate]:
+    """Page templates for this thread's builds, created once and reused across requests.
+    
+    Frames hold layout state while a document is built, so templates are shared between
+    sequential builds on one thread rather than across concurrent builds.
+    """
+    templates = getattr(_thread_templates, 'templates', None)
+    if templates is None:
+        page_width, page_height = A4
+        frame = Frame(
+            PAGE_MARGINS['leftMargin'],
+            PAGE_MARGINS['bottomMargin'],
+            page_width - PAGE_MARGINS['leftMargin'] - PAGE_MARGINS['rightMargin'],
+            page_height - PAGE_MARGINS['topMargin'] - PAGE_MARGINS['bottomMargin'],
+            id='normal'
+        )
+        templates = _thread_templates.templates = [PageTemplate(id='Page', frames=[frame], pagesize=A4)]
+    return templates
+
+# Connections kept per pooled HTTP client for slide image downloads
+HTTP_POOL_SIZE = 32
+
+# Write buffer for PDF output files (a handful of large writes instead of thousands of small ones)
+PDF_WRITE_BUFFER = 4 << 20
+
+def _open_pdf_output(path: str) -> BinaryIO:
+    """Open a PDF output file with a large write buffer, hinting sequential access to the page cache"""
+    output = open(path, 'wb', buffering=PDF_WRITE_BUFFER)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(output.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return output
+
+class _FlowableFeed(list):
+    """Flowable list that refills itself from an iterator of flowable lists as ReportLab drains it.
+    
+    doc.build() loops while len(flowables) and consumes from the front, so feeding it one
+    slide at a time keeps only the slide being laid out in memory instead of the whole story.
+    """
+    
+    def __init__(self, chunks: Iterable[List]):
+        super().__init__()
+        self._chunks = iter(chunks)
+    
+    def __len__(self):
+        while not super().__len__():
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self.extend(chunk)
+        return super().__len__()
+
+# Decks with at least this many slides are rendered as separate PDF chunks in parallel and merged
+SPLIT_BUILD_THRESHOLD = int(os.getenv('PDF_SPLIT_BUILD_THRESHOLD', 64))
+SPLIT_CHUNK_SLIDES = 16
+
+# Base stylesheet (getSampleStyleSheet builds a fresh sheet on every call)
+_SAMPLE_STYLES = getSampleStyleSheet()
+
+# Per presentation style: (style key, name, parent, fontSize, textColor, alignment, spaceAfter, fontName)
+_STYLE_PARAMS = {
+    'creative': (
+        ('title', 'CustomTitle', 'Heading1', 32, '#0066CC', TA_CENTER, 30, 'Helvetica-Bold'),
+        ('subtitle', 'CustomSubtitle', 'Heading2', 20, '#333333', TA_CENTER, 20, 'Helvetica'),
+        ('content', 'CustomContent', 'Normal', 14, '#2f2f2f', TA_LEFT, 12, 'Helvetica'),
+        ('slide_title', 'CustomSlideTitle', 'Heading2', 24, '#0066CC', TA_LEFT, 15, 'Helvetica-Bold'),
+    ),
+    'minimalist': (
+        ('title', 'CustomTitle', 'Heading1', 28, '#000000', TA_CENTER, 30, 'Helvetica-Bold'),
+        ('subtitle', 'CustomSubtitle', 'Heading2', 16, '#666666', TA_CENTER, 20, 'Helvetica'),
+        ('content', 'CustomContent', 'Normal', 12, '#333333', TA_LEFT, 10, 'Helvetica'),
+        ('slide_title', 'CustomSlideTitle', 'Heading2', 20, '#000000', TA_LEFT, 12, 'Helvetica-Bold'),
+    ),
+    'professional': (
+        ('title', 'CustomTitle', 'Heading1', 30, '#000000', TA_CENTER, 30, 'Helvetica-Bold'),
+        ('subtitle', 'CustomSubtitle', 'Heading2', 18, '#404040', TA_CENTER, 20, 'Helvetica'),
+        ('content', 'CustomContent', 'Normal', 13, '#2f2f2f', TA_LEFT, 12, 'Helvetica'),
+        ('slide_title', 'CustomSlideTitle', 'Heading2', 22, '#000000', TA_LEFT, 15, 'Helvetica-Bold'),
+    ),
+}
+
+@lru_cache(maxsize=8)
+def _custom_styles(style: str) -> MappingProxyType:
+    """Custom paragraph styles for a presentation style, shared read-only across presentations"""
+    params = _STYLE_PARAMS.get(style, _STYLE_PARAMS['professional'])  # professional/corporate by default
+    return MappingProxyType({
+        key: ParagraphStyle(
+            name,
+            parent=_SAMPLE_STYLES[parent],
+            fontSize=font_size,
+            textColor=HexColor(text_color),
+            alignment=alignment,
+            spaceAfter=space_after,
+            fontName=font_name
+        )
+        for key, name, parent, font_size, text_color, alignment, space_after, font_name in params
+    })
+
+@dataclass(slots=True)
+class Slide:
+    """The slide fields the PDF builders read, converted once per presentation from the matched slide dict"""
+    title: Optional[str] = None
+    content: str = ''
+    action: str = 'copy_exact'
+    sourcePresentation: str = ''
+    source_title: str = 'N/A'
+    slide_type: str = 'N/A'
+    formatting: Dict[str, Any] = field(default_factory=dict)
+    images: List[Dict[str, Any]] = field(default_factory=list)
+    
+    @classmethod
+    def from_dict(cls, slide_data: Dict[str, Any]) -> 'Slide':
+        return cls(
+            title=slide_data.get('title'),
+            content=slide_data.get('content') or '',
+            action=slide_data.get('action', 'copy_exact'),
+            sourcePresentation=slide_data.get('sourcePresentation') or '',
+            source_title=slide_data.get('source_title', 'N/A'),
+            slide_type=slide_data.get('slide_type', 'N/A'),
+            formatting=slide_data.get('formatting') or {},
+            images=slide_data.get('images') or []
+        )
+    
+    def title_or_default(self, slide_number: int) -> str:
+        return self.title if self.title is not None else f'Slide {slide_number}'
+
+@lru_cache(maxsize=256)
+def _formatted_style(parent: ParagraphStyle, style_attrs: tuple) -> ParagraphStyle:
+    """Content style overridden with a training-data formatting combination (as sorted attribute pairs)"""
+    return ParagraphStyle('CustomFormatted', parent=parent, **dict(style_attrs))
+
+@lru_cache(maxsize=4096)
+def _parsed_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """Parse paragraph markup once per (text, style); the cached paragraph is only used as a template"""
+    return Paragraph(text, style)
+
+def _paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """Paragraph for text and style, reusing the parsed fragments of identical earlier paragraphs.
+    
+    Repeated titles, headers and attributions skip ReportLab's markup parser; fragments are cloned
+    because every paragraph instance is laid out (and split) independently.
+    """
+    parsed = _parsed_paragraph(text, style)
+    return Paragraph(parsed.text, parsed.style, bulletText=parsed.bulletText, frags=[frag.clone() for frag in parsed.frags])
+
+# Per-process generator used by the flowable workers
+_worker_generator = None
+
+def _build_slide_flowables_worker(job) -> List:
+    """Build one slide's flowables in a worker process (must stay module-level to be picklable)"""
+    global _worker_generator
+    slide_data, slide_number, request_data = job
+    if _worker_generator is None:
+        _worker_generator = PDFGenerator()
+    styles = _custom_styles(request_data.get('style', 'professional'))
+    return _worker_generator._build_slide_flowables(slide_data, slide_number, request_data, styles)
+
+def _build_pdf_worker(job) -> str:
+    """Build a whole presentation PDF in a worker process; returns its path.
+    
+    ReportLab layout holds the GIL, so concurrent requests only scale (and leave the event loop
+    responsive) when each build runs in its own process.
+    """
+    global _worker_generator
+    slides, request_data, filepath = job
+    if _worker_generator is None:
+        _worker_generator = PDFGenerator()
+    styles = _custom_styles(request_data.get('style', 'professional'))
+    slide_stories = (
+        _worker_generator._build_slide_flowables(slide_data, i + 1, request_data, styles)
+        for i, slide_data in enumerate(slides)
+    )
+    _worker_generator._write_pdf(filepath, slide_stories, len(slides), request_data, styles)
+    return filepath
+
+def _build_pdf_chunk_worker(job) -> str:
+    """Render a run of slides into its own PDF file in a worker process; returns the chunk path"""
+    global _worker_generator
+    slides_chunk, start_number, total_slides, request_data, chunk_path = job
+    if _worker_generator is None:
+        _worker_generator = PDFGenerator()
+    styles = _custom_styles(request_data.get('style', 'professional'))
+    slide_stories = (
+        _worker_generator._build_slide_flowables(slide_data, start_number + i, request_data, styles)
+        for i, slide_data in enumerate(slides_chunk)
+    )
+    # Title goes at the front of the first chunk, conclusion at the end of the last
+    _worker_generator._write_pdf(
+        chunk_path, slide_stories, len(slides_chunk), request_data, styles,
+        with_title=start_number == 1,
+        with_conclusion=start_number + len(slides_chunk) - 1 == total_slides
+    )
+    return chunk_path
+
 class PDFGenerator:
+    # Output directories already created in this process
+    _dirs_created = set()
+    
     def __init__(self):
         self.output_dir = os.getenv('PRESENTATION_OUTPUT_DIR', './generated_presentations')
         self.ensure_output_dir()
+        self._s3_client = None
+        # Pooled HTTP clients for slide images, reused across presentations (created on first use)
+        self._http_session = None
+        self._http = None
+        # ReportLab isn't thread-safe; serializes in-process builds (worker-process builds don't need it)
+        self._build_lock = asyncio.Lock()
+        # Background preview generation tasks, by presentation id
+        self._preview_tasks: Dict[str, asyncio.Task] = {}
+        # Slide builder and progress note per action, resolved once instead of branching per slide;
+        # unknown actions fall back to full generation
+        self._slide_builders = {
+            'copy_exact': (self._add_exact_copy_slide, "🔄 Copying exact content (0 AI tokens)"),
+            'minor_enhancement': (self._add_enhanced_slide, "✨ Minor enhancement (~50 AI tokens)"),
+            'full_generation': (self._add_ai_generated_slide, "🤖 Full AI generation (~200 AI tokens)"),
+        }
+        # Synthetic visual renderers by visual type (flowcharts and unknown types get the generic listing)
+        self._visual_renderers = {
+            'infographic': self._render_infographic,
+            'icon': self._render_icon,
+            'steps': self._render_steps,
+            'tech_stack': self._render_tech_stack,
+            'innovation': self._render_innovation,
+            'flowchart': self._render_generic_visual,
+        }
     
     def ensure_output_dir(self):
         """Ensure output directory exists"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        self._ensure_dir(self.output_dir)
+    
+    @classmethod
+    def _ensure_dir(cls, path: str):
+        """Create a directory once per process; later calls skip the filesystem entirely"""
+        if path not in cls._dirs_created:
+            os.makedirs(path, exist_ok=True)
+            cls._dirs_created.add(path)
     
     async def generate_presentation(
         self,
-        slides: List[Dict[str, Any]],
+        slides: Iterable[Dict[str, Any]],
         presentation_id: str,
         request_data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Generate a PDF presentation from selected slides"""
+        """Generate a PDF presentation from selected slides (any iterable, consumed once)"""
         
         try:
-            print(f"🎨 PDF PRESENTATION GENERATOR STARTED")
-            print(f"   - Presentation ID: {presentation_id}")
-            print(f"   - Total Slides: {len(slides)}")
-            print(f"   - Customer: {request_data.get('customer', 'N/A')}")
-            print(f"   - Industry: {request_data.get('industry', 'N/A')}")
-            print(f"   - Style: {request_data.get('style', 'N/A')}")
+            # Builders only read a handful of fields; convert once instead of dict lookups per builder.
+            # This is the only pass over the caller's slides, so generators and cursors work too.
+            slides = [Slide.from_dict(slide_data) for slide_data in slides]
             
-            # Create PDF document
-            filename = f"{presentation_id}_{request_data['customer'].replace(' ', '_')}.pdf"
-            filepath = os.path.join(self.output_dir, filename)
-            
-            # Set up PDF document
-            doc = SimpleDocTemplate(
-                filepath,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
+            logger.info(
+                "🎨 PDF presentation generator started: id=%s slides=%d customer=%s industry=%s style=%s",
+                presentation_id, len(slides), request_data.get('customer', 'N/A'),
+                request_data.get('industry', 'N/A'), request_data.get('style', 'N/A')
             )
             
-            # Get styles
-            styles = getSampleStyleSheet()
-            custom_styles = self._create_custom_styles(request_data.get('style', 'professional'))
-            
-            # Build content
-            story = []
+            # Per-request strings the slide builders would otherwise rebuild for every slide
+            customer = request_data['customer']
+            industry = request_data.get('industry', '')
+            request_data = {
+                **request_data,
+                'titleSuffix': f" - {customer} ({industry})" if customer and industry else ""
+            }
             
-            # Add title slide
-            self._add_title_slide(story, request_data, custom_styles)
-            story.append(PageBreak())
-            
-            # Add content slides
-            for i, slide_data in enumerate(slides):
-                action = slide_data.get('action', 'copy_exact')
-                print(f"📄 PROCESSING SLIDE {i+1}/{len(slides)}")
-                print(f"   - Action: {action}")
-                print(f"   - Source: {slide_data.get('source_title', 'N/A')}")
-                print(f"   - Type: {slide_data.get('slide_type', 'N/A')}")
-                
-                if action == 'copy_exact':
-                    print(f"   - 🔄 Copying exact content (0 AI tokens)")
-                    self._add_exact_copy_slide(story, slide_data, i + 1, custom_styles)
-                elif action == 'minor_enhancement':
-                    print(f"   - ✨ Minor enhancement (~50 AI tokens)")
-                    self._add_enhanced_slide(story, slide_data, i + 1, request_data, custom_styles)
-                else:  # full_generation
-                    print(f"   - 🤖 Full AI generation (~200 AI tokens)")
-                    self._add_ai_generated_slide(story, slide_data, i + 1, request_data, custom_styles)
-                
-                print(f"   - ✅ Slide {i+1} completed")
-                print()
-                
-                # Add page break between slides
-                if i < len(slides) - 1:
-                    story.append(PageBreak())
+            # Create PDF document
+            safe_customer = _UNSAFE_FILENAME_RE.sub('_', customer)
+            filename = f"{presentation_id}_{safe_customer}.pdf"
+            filepath = str(Path(self.output_dir, filename))
             
-            # Add conclusion slide
-            self._add_conclusion_slide(story, request_data, custom_styles)
+            # Fetch remote slide images concurrently before the (synchronous) flowable build
+            await self._prefetch_images(slides)
             
-            # Build PDF
-            doc.build(story)
+            if len(slides) >= SPLIT_BUILD_THRESHOLD and (os.cpu_count() or 1) > 1:
+                # Large decks: render slide chunks to separate PDFs in parallel, then merge
+                await self._build_split_pdf(slides, request_data, filepath)
+            else:
+                await self._build_single_pdf(slides, request_data, filepath)
             
-            # Generate preview images
-            preview_urls = await self._generate_preview_images(filepath, presentation_id)
+            # Generate preview images in the background; callers collect them via wait_for_previews
+            self.track_previews(presentation_id, self._generate_preview_images(filepath, presentation_id))
             
             return {
                 'filepath': filepath,
                 'filename': filename,
-                'previewUrls': preview_urls,
+                'previewUrls': [],
+                'previewStatus': 'generating',
                 'slideCount': len(slides) + 2,  # +2 for title and conclusion
                 'status': 'completed'
             }
             
         except Exception as e:
-            logger.error(f"Error generating PDF presentation: {e}")
+            logger.error("Error generating PDF presentation: %s", e)
             raise e
     
-    def _create_custom_styles(self, style: str) -> Dict[str, Any]:
-        """Create custom styles based on presentation style"""
-        styles = getSampleStyleSheet()
-        custom_styles = {}
-        
-        if style == 'creative':
-            # Creative styling
-            custom_styles['title'] = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=32,
-                textColor=HexColor('#0066CC'),
-                alignment=TA_CENTER,
-                spaceAfter=30,
-                fontName='Helvetica-Bold'
-            )
-            custom_styles['subtitle'] = ParagraphStyle(
-                'CustomSubtitle',
-                parent=styles['Heading2'],
-                fontSize=20,
-                textColor=HexColor('#333333'),
-                alignment=TA_CENTER,
-                spaceAfter=20,
-                fontName='Helvetica'
-            )
-            custom_styles['content'] = ParagraphStyle(
-                'CustomContent',
-                parent=styles['Normal'],
-                fontSize=14,
-                textColor=HexColor('#2f2f2f'),
-                alignment=TA_LEFT,
-                spaceAfter=12,
-                fontName='Helvetica'
-            )
-            custom_styles['slide_title'] = ParagraphStyle(
-                'CustomSlideTitle',
-                parent=styles['Heading2'],
-                fontSize=24,
-                textColor=HexColor('#0066CC'),
-                alignment=TA_LEFT,
-                spaceAfter=15,
-                fontName='Helvetica-Bold'
+    def track_previews(self, presentation_id: str, previews: Awaitable[List[str]]):
+        """Run a preview job in the background and report on it via get_preview_status / wait_for_previews"""
+        self._preview_tasks[presentation_id] = asyncio.ensure_future(previews)
+    
+    def get_preview_status(self, presentation_id: str) -> Optional[Dict[str, Any]]:
+        """Status of an in-flight preview task, or None if this process isn't tracking one"""
+        task = self._preview_tasks.get(presentation_id)
+        if task is None:
+            return None
+        if not task.done():
+            return {'previewStatus': 'generating', 'previewUrls': []}
+        return {'previewStatus': 'completed', 'previewUrls': task.result()}
+    
+    async def wait_for_previews(self, presentation_id: str) -> List[str]:
+        """Wait for a presentation's background preview task (it stays tracked until release_previews)"""
+        task = self._preview_tasks.get(presentation_id)
+        if task is None:
+            return []
+        return await task
+    
+    def release_previews(self, presentation_id: str):
+        """Stop tracking a preview task; call once its URLs are persisted, so status reads never see a gap"""
+        self._preview_tasks.pop(presentation_id, None)
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Shared aiohttp session for image prefetches, so connections to image hosts stay open between decks"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, limit_per_host=8, ttl_dns_cache=300)
             )
+        return self._http_session
+    
+    def _get_http_client(self):
+        """Shared requests session for inline image downloads during the (synchronous) build"""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            self._http = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=2)
+            self._http.mount('https://', adapter)
+            self._http.mount('http://', adapter)
+        return self._http
+    
+    async def close(self):
+        """Close the pooled image download session"""
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+    
+    async def _prefetch_images(self, slides: List[Slide]):
+        """Download every URL image in the deck concurrently (through an on-disk cache) into prefetched_image"""
+        url_images = {}
+        for slide in slides:
+            for img_data in slide.images:
+                if isinstance(img_data, dict) and img_data.get('image_url') and not (img_data.get('image_data') or img_data.get('image_blob')):
+                    url_images.setdefault(img_data['image_url'], []).append(img_data)
+        if not url_images:
+            return
+        
+        cache_dir = os.path.join(self.output_dir, 'img_cache')
+        self._ensure_dir(cache_dir)
+        
+        def cache_path(url: str) -> str:
+            return os.path.join(cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest())
+        
+        def read_cached(url: str) -> Optional[bytes]:
+            try:
+                with open(cache_path(url), 'rb') as f:
+                    return f.read()
+            except OSError:
+                return None
+        
+        def write_cached(url: str, content: bytes):
+            # Write then rename so concurrent requests never read a partial file
+            temp_path = f"{cache_path(url)}.{uuid.uuid4().hex}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, cache_path(url))
+        
+        loop = asyncio.get_running_loop()
+        urls = list(url_images)
+        cached = await loop.run_in_executor(None, lambda: [read_cached(url) for url in urls])
+        fetched = dict(zip(urls, cached))
+        misses = [url for url in urls if fetched[url] is None]
+        
+        if misses:
+            logger.info("🌐 Prefetching %s slide images (%s cached)", len(misses), len(urls) - len(misses))
             
-        elif style == 'minimalist':
-            # Minimalist styling
-            custom_styles['title'] = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=28,
-                textColor=HexColor('#000000'),
-                alignment=TA_CENTER,
-                spaceAfter=30,
-                fontName='Helvetica-Bold'
-            )
-            custom_styles['subtitle'] = ParagraphStyle(
-                'CustomSubtitle',
-                parent=styles['Heading2'],
-                fontSize=16,
-                textColor=HexColor('#666666'),
-                alignment=TA_CENTER,
-                spaceAfter=20,
-                fontName='Helvetica'
-            )
-            custom_styles['content'] = ParagraphStyle(
-                'CustomContent',
-                parent=styles['Normal'],
-                fontSize=12,
-                textColor=HexColor('#333333'),
-                alignment=TA_LEFT,
-                spaceAfter=10,
-                fontName='Helvetica'
-            )
-            custom_styles['slide_title'] = ParagraphStyle(
-                'CustomSlideTitle',
-                parent=styles['Heading2'],
-                fontSize=20,
-                textColor=HexColor('#000000'),
-                alignment=TA_LEFT,
-                spaceAfter=12,
-                fontName='Helvetica-Bold'
-            )
+            async def fetch(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+                try:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return await response.read()
+                except Exception as e:
+                    logger.warning("❌ Failed to prefetch image %s: %s", url, e)
+                    return None
             
-        else:  # professional/corporate
-            # Professional styling
-            custom_styles['title'] = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=30,
-                textColor=HexColor('#000000'),
-                alignment=TA_CENTER,
-                spaceAfter=30,
-                fontName='Helvetica-Bold'
-            )
-            custom_styles['subtitle'] = ParagraphStyle(
-                'CustomSubtitle',
-                parent=styles['Heading2'],
-                fontSize=18,
-                textColor=HexColor('#404040'),
-                alignment=TA_CENTER,
-                spaceAfter=20,
-                fontName='Helvetica'
-            )
-            custom_styles['content'] = ParagraphStyle(
-                'CustomContent',
-                parent=styles['Normal'],
-                fontSize=13,
-                textColor=HexColor('#2f2f2f'),
-                alignment=TA_LEFT,
-                spaceAfter=12,
-                fontName='Helvetica'
-            )
-            custom_styles['slide_title'] = ParagraphStyle(
-                'CustomSlideTitle',
-                parent=styles['Heading2'],
-                fontSize=22,
-                textColor=HexColor('#000000'),
-                alignment=TA_LEFT,
-                spaceAfter=15,
-                fontName='Helvetica-Bold'
-            )
+            session = self._get_http_session()
+            results = await asyncio.gather(*[fetch(session, url) for url in misses])
+            
+            downloaded = {url: content for url, content in zip(misses, results) if content}
+            fetched.update(downloaded)
+            await loop.run_in_executor(None, lambda: [write_cached(url, content) for url, content in downloaded.items()])
         
-        return custom_styles
+        for url, img_list in url_images.items():
+            for img_data in img_list:
+                if fetched.get(url):
+                    img_data['prefetched_image'] = fetched[url]
+                else:
+                    # Already failed once; don't retry synchronously during the build
+                    img_data['prefetch_failed'] = True
     
-    def _add_title_slide(self, story: List, request_data: Dict[str, Any], styles: Dict[str, Any]):
-        """Add title slide to presentation"""
-        # Add title
-        title_text = f"{request_data['customer']} - {request_data['industry']}"
-        story.append(Paragraph(title_text, styles['title']))
+    def _create_document(self, filepath: Union[str, BinaryIO]) -> BaseDocTemplate:
+        """Create the PDF document used for every presentation (and every split chunk)"""
+        return BaseDocTemplate(filepath, pagesize=A4, pageTemplates=_page_templates(), **PAGE_MARGINS)
+    
+    async def _build_single_pdf(self, slides: List[Slide], request_data: Dict[str, Any], filepath: str):
+        """Build the whole presentation as one ReportLab document, streamed slide by slide"""
+        loop = asyncio.get_running_loop()
+        _disable_shape_checking()
+        
+        if len(slides) < PARALLEL_SLIDE_THRESHOLD:
+            # Small decks: the whole build runs in one worker process
+            try:
+                await loop.run_in_executor(_get_slide_pool(), _build_pdf_worker, (slides, request_data, filepath))
+                return
+            except Exception as e:
+                logger.warning("Worker PDF build failed, building in-process: %s", e)
         
-        # Add subtitle
-        subtitle_text = f"{request_data['useCase']} Presentation"
-        story.append(Paragraph(subtitle_text, styles['subtitle']))
+        # Get styles
+        custom_styles = _custom_styles(request_data.get('style', 'professional'))
+        
+        # Content slides are built per slide (in parallel for large decks, lazily otherwise)
+        slide_stories = await self._build_all_slide_flowables(slides, request_data, custom_styles)
+        
+        async with self._build_lock:
+            await loop.run_in_executor(
+                _PDF_POOL, self._write_pdf, filepath, slide_stories, len(slides), request_data, custom_styles
+            )
+    
+    def _write_pdf(
+        self,
+        filepath: str,
+        slide_stories: Iterable[List],
+        slide_count: int,
+        request_data: Dict[str, Any],
+        styles: Dict[str, Any],
+        with_title: bool = True,
+        with_conclusion: bool = True
+    ):
+        """Lay out the title slide, content slides and conclusion slide into one PDF file.
+        
+        Each slide's flowables are built into their own list and handed to ReportLab one slide
+        at a time, so no story list for the whole document is ever accumulated.
+        """
+        # Title and conclusion slides are built once and spliced around the content
+        front_matter, back_matter = self._build_bookends(request_data, styles)
+        
+        def iter_story() -> Iterator[List]:
+            # Add title slide
+            if with_title:
+                yield front_matter
+            
+            # Add content slides with page breaks between them
+            for i, slide_story in enumerate(slide_stories):
+                if i < slide_count - 1:
+                    slide_story.append(PageBreak())
+                yield slide_story
+            
+            # Add conclusion slide
+            if with_conclusion:
+                yield back_matter
         
-        # Add some spacing
-        story.append(Spacer(1, 0.5*inch))
+        # Build PDF straight into a large-buffered file, feeding flowables as pages are laid out
+        with _open_pdf_output(filepath) as output:
+            doc = self._create_document(output)
+            doc.build(_FlowableFeed(iter_story()))
     
-    def _add_exact_copy_slide(self, story: List, slide_data: Dict[str, Any], slide_number: int, styles: Dict[str, Any]):
+    async def _build_split_pdf(self, slides: List[Slide], request_data: Dict[str, Any], filepath: str):
+        """Render chunks of slides into temp PDFs across worker processes and merge them in order"""
+        # Filesystem work stays off the event loop too: the chunk directory holds one PDF per chunk
+        chunk_dir = await asyncio.to_thread(tempfile.mkdtemp, prefix='pdf_chunks_', dir=self.output_dir)
+        try:
+            jobs = [
+                (
+                    slides[start:start + SPLIT_CHUNK_SLIDES],
+                    start + 1,
+                    len(slides),
+                    request_data,
+                    os.path.join(chunk_dir, f"chunk_{start // SPLIT_CHUNK_SLIDES:05d}.pdf")
+                )
+                for start in range(0, len(slides), SPLIT_CHUNK_SLIDES)
+            ]
+            logger.info("🧩 Rendering %s slides as %s PDF chunks in parallel", len(slides), len(jobs))
+            
+            loop = asyncio.get_running_loop()
+            pool = _get_slide_pool()
+            chunk_paths = await asyncio.gather(
+                *[loop.run_in_executor(pool, _build_pdf_chunk_worker, job) for job in jobs]
+            )
+            
+            def merge():
+                writer = PdfWriter()
+                for chunk_path in chunk_paths:
+                    writer.append(chunk_path)
+                with _open_pdf_output(filepath) as output:
+                    writer.write(output)
+            
+            await loop.run_in_executor(_PDF_POOL, merge)
+        finally:
+            await asyncio.to_thread(shutil.rmtree, chunk_dir, ignore_errors=True)
+    
+    async def _build_all_slide_flowables(
+        self,
+        slides: List[Slide],
+        request_data: Dict[str, Any],
+        styles: Dict[str, Any]
+    ) -> Iterable[List]:
+        """Build the flowables for every slide, in slide order (lazily unless built in parallel)"""
+        if len(slides) >= PARALLEL_SLIDE_THRESHOLD and (os.cpu_count() or 1) > 1:
+            # Paragraph construction parses markup in pure Python; each slide is independent,
+            # so fan out across processes and let the workers rebuild the styles locally
+            jobs = [(slide_data, i + 1, request_data) for i, slide_data in enumerate(slides)]
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    lambda: list(_get_slide_pool().map(_build_slide_flowables_worker, jobs, chunksize=8))
+                )
+            except Exception as e:
+                logger.warning("Parallel slide build failed, building sequentially: %s", e)
+        
+        return (
+            self._build_slide_flowables(slide_data, i + 1, request_data, styles)
+            for i, slide_data in enumerate(slides)
+        )
+    
+    def _build_slide_flowables(
+        self,
+        slide_data: Slide,
+        slide_number: int,
+        request_data: Dict[str, Any],
+        styles: Dict[str, Any]
+    ) -> List:
+        """Build the flowables for one content slide according to its action"""
+        story = []
+        action, source_title, slide_type = slide_data.action, slide_data.source_title, slide_data.slide_type
+        builder, note = self._slide_builders.get(action, self._slide_builders['full_generation'])
+        # Level-gated with deferred formatting: no work per slide unless DEBUG is enabled
+        logger.debug("📄 slide %d action=%s src=%s type=%s: %s", slide_number, action, source_title, slide_type, note)
+        builder(story, slide_data, slide_number, request_data, styles)
+        return story
+    
+    def _build_bookends(self, request_data: Dict[str, Any], styles: Dict[str, Any]) -> Tuple[List, List]:
+        """Build the title slide (front matter) and conclusion slide (back matter) flowables"""
+        customer_line = f"{request_data['customer']} - {request_data['industry']}"
+        front_matter = [
+            _paragraph(customer_line, styles['title']),
+            _paragraph(f"{request_data['useCase']} Presentation", styles['subtitle']),
+            Spacer(1, 0.5*inch),
+            PageBreak()
+        ]
+        back_matter = [
+            _paragraph("Thank You", styles['title']),
+            _paragraph(f"Questions & Discussion<br/><br/>{customer_line}", styles['subtitle'])
+        ]
+        return front_matter, back_matter
+    
+    def _add_exact_copy_slide(self, story: List, slide_data: Slide, slide_number: int, request_data: Dict[str, Any], styles: Dict[str, Any]):
         """Add slide by copying exact content from training data with all visual elements"""
-        print(f"📄 EXACT COPY: Processing slide {slide_number}")
+        logger.debug("📄 EXACT COPY: Processing slide %s", slide_number)
         
         # Add slide title with original formatting
-        title = slide_data.get('title', f'Slide {slide_number}')
-        formatting_data = slide_data.get('formatting', {})
+        title = slide_data.title_or_default(slide_number)
+        formatting_data = slide_data.formatting
         
         if formatting_data and 'title' in formatting_data:
             # Apply original title formatting
             formatted_title = self._create_formatted_paragraph(title, formatting_data['title'], styles)
             story.append(formatted_title)
         else:
-            story.append(Paragraph(title, styles['slide_title']))
+            story.append(_paragraph(title, styles['slide_title']))
         
         # Add visual elements exactly as they were in training data
-        images = slide_data.get('images', [])
-        print(f"📸 EXACT COPY: Slide {slide_number} has {len(images)} visual elements")
+        images = slide_data.images
+        logger.debug("📸 EXACT COPY: Slide %s has %s visual elements", slide_number, len(images))
         
         if images:
             story.append(Spacer(1, 0.1*inch))
             
-            print(f"🎯 PROCESSING {len(images)} VISUAL ELEMENTS FOR EXACT COPY")
+            logger.debug("🎯 PROCESSING %s VISUAL ELEMENTS FOR EXACT COPY", len(images))
             
             for img_data in images:
                 img_title = img_data.get('title', 'Visual Element')
-                print(f"🎨 EXACT COPY VISUAL: {img_title} (type: {img_data.get('type')})")
+                visual_type = img_data.get('type')
+                logger.debug("🎨 EXACT COPY VISUAL: %s (type: %s)", img_title, visual_type)
                 
                 # Detect image type and handle accordingly
                 if img_data.get('image_data') or img_data.get('image_blob'):
                     # This is a base64-encoded image from training data
-                    print(f"📸 EXACT COPY BASE64 IMAGE: {img_title}")
+                    logger.debug("📸 EXACT COPY BASE64 IMAGE: %s", img_title)
                     self._add_base64_image(story, img_data, styles)
                 elif img_data.get('image_url'):
                     # This is an external URL image from training data
-                    print(f"🌐 EXACT COPY URL IMAGE: {img_title} - {img_data.get('image_url')}")
+                    logger.debug("🌐 EXACT COPY URL IMAGE: %s - %s", img_title, img_data.get('image_url'))
                     self._add_url_image(story, img_data, styles)
-                elif img_data.get('type') == 'chart' and img_data.get('data'):
+                elif visual_type == 'chart' and img_data.get('data'):
                     # This is synthetic chart data
-                    print(f"📊 EXACT COPY CHART: {img_title}")
+                    logger.debug("📊 EXACT COPY CHART: %s", img_title)
                     self._add_chart_visual(story, img_data, styles)
-                elif img_data.get('type') in ['infographic', 'icon', 'steps', 'tech_stack', 'innovation', 'flowchart']:
+                elif visual_type in self._visual_renderers:
                     # This is synthetic visual element
-                    print(f"🎨 EXACT COPY SYNTHETIC: {img_title} (type: {img_data.get('type')})")
+                    logger.debug("🎨 EXACT COPY SYNTHETIC: %s (type: %s)", img_title, visual_type)
                     self._add_synthetic_visual(story, img_data, styles)
                 else:
                     # Generic fallback
-                    print(f"⚠️ EXACT COPY UNKNOWN TYPE: {img_title}")
-                    story.append(Paragraph(f"📊 {img_title}", styles['slide_title']))
-                    data = img_data.get('data', {})
-                    if isinstance(data, dict):
-                        for key, value in data.items():
-                            story.append(Paragraph(f"• {key}: {value}", styles['content']))
+                    logger.warning("⚠️ EXACT COPY UNKNOWN TYPE: %s", img_title)
+                    self._render_generic_visual(story, img_title, img_data.get('data', {}), styles)
                     story.append(Spacer(1, 0.1*inch))
         
         # Add content with original formatting
-        content = slide_data.get('content', '')
+        content = slide_data.content
         if content:
             # Apply formatting if available
-            formatting_data = slide_data.get('formatting', {})
-            
-            # Split content into bullet points
-            content_lines = content.split('\n')
-            for line in content_lines:
-                if line.strip():
-                    # Add bullet point with formatting
-                    bullet_text = f"• {line.strip()}"
-                    
-                    # Create paragraph with formatting
-                    if formatting_data and 'text_shape_1' in formatting_data:
-                        # Apply formatting from training data
-                        formatted_para = self._create_formatted_paragraph(bullet_text, formatting_data['text_shape_1'], styles)
-                        story.append(formatted_para)
-                    else:
-                        # Use default styling
-                        story.append(Paragraph(bullet_text, styles['content']))
+            formatting_data = slide_data.formatting
+            
+            # All bullet points go into one paragraph
+            bullet_text = self._bullets(content)
+            if bullet_text:
+                # Create paragraph with formatting
+                if formatting_data and 'text_shape_1' in formatting_data:
+                    # Apply formatting from training data
+                    story.append(self._create_formatted_paragraph(bullet_text, formatting_data['text_shape_1'], styles))
+                else:
+                    # Use default styling
+                    story.append(_paragraph(bullet_text, styles['content']))
         
         # Add source attribution
-        source = slide_data.get('sourcePresentation', '')
+        source = slide_data.sourcePresentation
         if source:
             source_text = f"<i>Source: {source}</i>"
             story.append(Spacer(1, 0.2*inch))
-            story.append(Paragraph(source_text, styles['content']))
+            story.append(_paragraph(source_text, styles['content']))
         
-        print(f"✅ EXACT COPY: Slide {slide_number} completed with {len(images)} visual elements")
+        logger.debug("✅ EXACT COPY: Slide %s completed with %s visual elements", slide_number, len(images))
     
-    def _add_content_slide(self, story: List, slide_data: Dict[str, Any], slide_number: int, styles: Dict[str, Any]):
+    def _add_content_slide(self, story: List, slide_data: Slide, slide_number: int, styles: Dict[str, Any]):
         """Add a content slide to presentation (legacy method)"""
         # Add slide title
-        title = slide_data.get('title', f'Slide {slide_number}')
-        story.append(Paragraph(title, styles['slide_title']))
+        title = slide_data.title_or_default(slide_number)
+        story.append(_paragraph(title, styles['slide_title']))
         
         # Add visual elements if available
-        images = slide_data.get('images', [])
-        print(f"🔍 DEBUG: Slide {slide_number} has {len(images)} visual elements")
+        images = slide_data.images
+        logger.debug("🔍 Slide %s has %s visual elements", slide_number, len(images))
         if images:
-            print(f"📊 Visual elements: {images}")
             story.append(Spacer(1, 0.1*inch))
             
             # Add visual section header
-            story.append(Paragraph("📊 Visual Elements", styles['slide_title']))
+            story.append(_paragraph("📊 Visual Elements", styles['slide_title']))
             story.append(Spacer(1, 0.1*inch))
             
-            print(f"🎯 PROCESSING {len(images)} VISUAL ELEMENTS FOR SLIDE {slide_number}")
+            logger.debug("🎯 PROCESSING %s VISUAL ELEMENTS FOR SLIDE %s", len(images), slide_number)
             
             for img_data in images[:2]:  # Limit to 2 images per slide
                 img_title = img_data.get('title', 'Visual Element')
-                print(f"🎨 PROCESSING VISUAL ELEMENT: {img_title} (type: {img_data.get('type')})")
+                visual_type = img_data.get('type')
+                logger.debug("🎨 PROCESSING VISUAL ELEMENT: %s (type: %s)", img_title, visual_type)
                 
                 # Detect image type and handle accordingly
                 if img_data.get('image_data') or img_data.get('image_blob'):
                     # This is a base64-encoded image from training data
-                    print(f"📸 RENDERING BASE64 IMAGE: {img_title}")
+                    logger.debug("📸 RENDERING BASE64 IMAGE: %s", img_title)
                     self._add_base64_image(story, img_data, styles)
                 elif img_data.get('image_url'):
                     # This is an external URL image from training data
-                    print(f"🌐 RENDERING URL IMAGE: {img_title} - {img_data.get('image_url')}")
+                    logger.debug("🌐 RENDERING URL IMAGE: %s - %s", img_title, img_data.get('image_url'))
                     self._add_url_image(story, img_data, styles)
-                elif img_data.get('type') == 'chart' and img_data.get('data'):
+                elif visual_type == 'chart' and img_data.get('data'):
                     # This is synthetic chart data
-                    print(f"📊 RENDERING SYNTHETIC CHART: {img_title}")
+                    logger.debug("📊 RENDERING SYNTHETIC CHART: %s", img_title)
                     self._add_chart_visual(story, img_data, styles)
-                elif img_data.get('type') in ['infographic', 'icon', 'steps', 'tech_stack', 'innovation', 'flowchart']:
+                elif visual_type in self._visual_renderers:
                     # This is synthetic visual element
-                    print(f"🎨 RENDERING SYNTHETIC VISUAL: {img_title} (type: {img_data.get('type')})")
+                    logger.debug("🎨 RENDERING SYNTHETIC VISUAL: %s (type: %s)", img_title, visual_type)
                     self._add_synthetic_visual(story, img_data, styles)
                 else:
                     # Generic fallback
-                    print(f"⚠️ UNKNOWN VISUAL TYPE: {img_title}")
-                    story.append(Paragraph(f"📊 {img_title}", styles['slide_title']))
-                    data = img_data.get('data', {})
-                    if isinstance(data, dict):
-                        for key, value in data.items():
-                            story.append(Paragraph(f"• {key}: {value}", styles['content']))
+                    logger.warning("⚠️ UNKNOWN VISUAL TYPE: %s", img_title)
+                    self._render_generic_visual(story, img_title, img_data.get('data', {}), styles)
                     story.append(Spacer(1, 0.1*inch))
         
         # Add content
-        content = slide_data.get('content', '')
+        content = slide_data.content
         if content:
             # Apply formatting if available
-            formatting_data = slide_data.get('formatting', {})
-            
-            # Split content into bullet points
-            content_lines = content.split('\n')
-            for line in content_lines:
-                if line.strip():
-                    # Add bullet point with formatting
-                    bullet_text = f"• {line.strip()}"
-                    
-                    # Create paragraph with formatting
-                    if formatting_data and 'text_shape_1' in formatting_data:
-                        # Apply formatting from training data
-                        formatted_para = self._create_formatted_paragraph(bullet_text, formatting_data['text_shape_1'], styles)
-                        story.append(formatted_para)
-                    else:
-                        # Use default styling
-                        story.append(Paragraph(bullet_text, styles['content']))
+            formatting_data = slide_data.formatting
+            
+            # All bullet points go into one paragraph
+            bullet_text = self._bullets(content)
+            if bullet_text:
+                # Create paragraph with formatting
+                if formatting_data and 'text_shape_1' in formatting_data:
+                    # Apply formatting from training data
+                    story.append(self._create_formatted_paragraph(bullet_text, formatting_data['text_shape_1'], styles))
+                else:
+                    # Use default styling
+                    story.append(_paragraph(bullet_text, styles['content']))
         
         # Add source attribution if available
-        source = slide_data.get('sourcePresentation', '')
+        source = slide_data.sourcePresentation
         if source:
             source_text = f"<i>Source: {source}</i>"
             story.append(Spacer(1, 0.2*inch))
-            story.append(Paragraph(source_text, styles['content']))
+            story.append(_paragraph(source_text, styles['content']))
     
-    def _add_enhanced_slide(self, story: List, slide_data: Dict[str, Any], slide_number: int, request_data: Dict[str, Any], styles: Dict[str, Any]):
+    def _add_enhanced_slide(self, story: List, slide_data: Slide, slide_number: int, request_data: Dict[str, Any], styles: Dict[str, Any]):
         """Add slide with minor AI enhancement"""
         # Enhance title slightly
-        original_title = slide_data.get('title', f'Slide {slide_number}')
-        enhanced_title = self._enhance_title(original_title, request_data)
+        original_title = slide_data.title_or_default(slide_number)
+        enhanced_title = self._enhance_title(original_title, request_data['titleSuffix'])
         
-        story.append(Paragraph(enhanced_title, styles['slide_title']))
+        story.append(_paragraph(enhanced_title, styles['slide_title']))
         
         # Use original content
-        content = slide_data.get('content', '')
+        content = slide_data.content
         if content:
-            content_lines = content.split('\n')
-            for line in content_lines:
-                if line.strip():
-                    bullet_text = f"• {line.strip()}"
-                    story.append(Paragraph(bullet_text, styles['content']))
+            bullet_text = self._bullets(content)
+            if bullet_text:
+                story.append(_paragraph(bullet_text, styles['content']))
         
         # Add source attribution
-        source = slide_data.get('sourcePresentation', '')
+        source = slide_data.sourcePresentation
         if source:
             source_text = f"<i>Source: {source}</i>"
             story.append(Spacer(1, 0.2*inch))
-            story.append(Paragraph(source_text, styles['content']))
+            story.append(_paragraph(source_text, styles['content']))
     
-    def _add_ai_generated_slide(self, story: List, slide_data: Dict[str, Any], slide_number: int, request_data: Dict[str, Any], styles: Dict[str, Any]):
+    def _add_ai_generated_slide(self, story: List, slide_data: Slide, slide_number: int, request_data: Dict[str, Any], styles: Dict[str, Any]):
         """Add slide with full AI generation"""
         # Generate enhanced content using AI
         enhanced_content = self._generate_ai_content(slide_data, request_data)
         
         title = enhanced_content.get('title', f'Slide {slide_number}')
-        story.append(Paragraph(title, styles['slide_title']))
+        story.append(_paragraph(title, styles['slide_title']))
         
         content = enhanced_content.get('content', '')
         if content:
-            content_lines = content.split('\n')
-            for line in content_lines:
-                if line.strip():
-                    bullet_text = f"• {line.strip()}"
-                    story.append(Paragraph(bullet_text, styles['content']))
+            bullet_text = self._bullets(content)
+            if bullet_text:
+                story.append(_paragraph(bullet_text, styles['content']))
         
         # Add source attribution
-        source = slide_data.get('sourcePresentation', '')
+        source = slide_data.sourcePresentation
         if source:
             source_text = f"<i>Source: {source}</i>"
             story.append(Spacer(1, 0.2*inch))
-            story.append(Paragraph(source_text, styles['content']))
+            story.append(_paragraph(source_text, styles['content']))
     
-    def _add_conclusion_slide(self, story: List, request_data: Dict[str, Any], styles: Dict[str, Any]):
-        """Add conclusion slide to presentation"""
-        # Add title
-        story.append(Paragraph("Thank You", styles['title']))
-        
-        # Add subtitle
-        subtitle_text = f"Questions & Discussion<br/><br/>{request_data['customer']} - {request_data['industry']}"
-        story.append(Paragraph(subtitle_text, styles['subtitle']))
+    def _bullets(self, content: str) -> str:
+        """Render content lines as bullet points in a single paragraph's markup (one parse per slide)"""
+        lines = [escape(match.group().rstrip()) for match in _LINE_RE.finditer(content)]
+        # The bullet prefix rides on the join separator instead of being formatted into every line
+        return _BULLET + _BULLET_BREAK.join(lines) if lines else ""
     
-    def _enhance_title(self, original_title: str, request_data: Dict[str, Any]) -> str:
-        """Enhance title with minimal processing (no AI cost)"""
-        customer = request_data.get('customer', '')
-        industry = request_data.get('industry', '')
-        
-        if customer and industry:
-            return f"{original_title} - {customer} ({industry})"
-        return original_title
+    def _enhance_title(self, original_title: str, title_suffix: str) -> str:
+        """Enhance title with minimal processing (no AI cost); the suffix is precomputed per request"""
+        return original_title + title_suffix
     
     def _create_bar_chart(self, data: Dict[str, Any], title: str) -> Optional[Drawing]:
         """Create a bar chart from data"""
         try:
-            print(f"🎨 Starting chart creation for {title}")
-            # Create drawing
-            drawing = Drawing(400, 200)
+            logger.debug("🎨 Starting chart creation for %s", title)
             
-            # Create bar chart
-            chart = VerticalBarChart()
-            chart.x = 50
-            chart.y = 50
-            chart.height = 150
-            chart.width = 300
+            # Prepare data (in category order, which is also the cache key)
+            items = tuple(data.items())
             
-            # Prepare data
-            years = list(data.keys())
-            values = list(data.values())
+            logger.debug("📊 Chart data: %s", items)
             
-            print(f"📊 Chart data - Years: {years}, Values: {values}")
+            # Slides often repeat a dataset; each use gets its own flowable sharing the built chart
+            drawing = copy.copy(_bar_chart_drawing(items))
             
-            chart.data = [values]
-            chart.categoryAxis.categoryNames = years
-            chart.categoryAxis.labels.fontSize = 10
-            chart.valueAxis.valueMin = 0
-            chart.valueAxis.valueMax = max(values) * 1.1
-            
-            # Add chart to drawing
-            drawing.add(chart)
-            
-            print(f"✅ Chart created successfully for {title}")
+            logger.debug("✅ Chart created successfully for %s", title)
             return drawing
             
         except Exception as e:
-            print(f"❌ Error creating chart for {title}: {e}")
+            logger.warning("❌ Error creating chart for %s: %s", title, e)
             return None
     
     def _add_base64_image(self, story: List, img_data: Dict[str, Any], styles: Dict[str, Any]):
@@ -528,36 +969,36 @@ class PDFGenerator:
             from reportlab.lib.utils import ImageReader
             from reportlab.platypus import Image
             
-            print(f"📸 PROCESSING BASE64 IMAGE: {img_data.get('title', 'Visual Element')}")
+            logger.debug("📸 PROCESSING BASE64 IMAGE: %s", img_data.get('title', 'Visual Element'))
             
             # Check if it's a GIF
             is_gif = img_data.get('is_gif', False)
             if is_gif:
-                print(f"🎬 Processing GIF image: {img_data.get('title', 'Visual Element')}")
+                logger.debug("🎬 Processing GIF image: %s", img_data.get('title', 'Visual Element'))
             
             # Handle both 'image_data' (base64 string) and raw binary
             image_data_field = img_data.get('image_data') or img_data.get('image_blob')
             
             if not image_data_field:
-                print(f"❌ No image data found in: {img_data}")
-                story.append(Paragraph(f"[Image: {img_data.get('title', 'Visual Element')}]", styles['content']))
+                logger.warning("❌ No image data found in: %s", img_data)
+                story.append(_paragraph(f"[Image: {img_data.get('title', 'Visual Element')}]", styles['content']))
                 return
             
             # Decode base64 image data
             if isinstance(image_data_field, str):
                 # Already base64 encoded
-                print(f"📸 Decoding base64 string (length: {len(image_data_field)})")
+                logger.debug("📸 Decoding base64 string (length: %s)", len(image_data_field))
                 image_bytes = base64.b64decode(image_data_field)
             else:
                 # Raw bytes
-                print(f"📸 Using raw bytes (length: {len(image_data_field)})")
+                logger.debug("📸 Using raw bytes (length: %s)", len(image_data_field))
                 image_bytes = image_data_field
             
             # Handle GIF conversion to static image for PDF
             if is_gif:
                 try:
                     from PIL import Image as PILImage
-                    print(f"🎬 Converting GIF to static image for PDF")
+                    logger.debug("🎬 Converting GIF to static image for PDF")
                     gif_buffer = io.BytesIO(image_bytes)
                     gif_image = PILImage.open(gif_buffer)
                     
@@ -565,10 +1006,10 @@ class PDFGenerator:
                     png_buffer = io.BytesIO()
                     gif_image.save(png_buffer, format='PNG')
                     image_bytes = png_buffer.getvalue()
-                    print(f"✅ GIF converted to PNG (size: {len(image_bytes)} bytes)")
+                    logger.debug("✅ GIF converted to PNG (size: %s bytes)", len(image_bytes))
                     
                 except Exception as e:
-                    print(f"⚠️ Failed to convert GIF, using original: {e}")
+                    logger.warning("⚠️ Failed to convert GIF, using original: %s", e)
             
             image_buffer = io.BytesIO(image_bytes)
             
@@ -598,23 +1039,22 @@ class PDFGenerator:
                 img_width = max_width
                 img_height = img_height * scale_factor
             
-            print(f"📸 Image dimensions: {img.getSize()} -> {img_width:.1f}x{img_height:.1f} (aspect ratio preserved)")
+            logger.debug("📸 Image dimensions: %s -> %.1fx%.1f (aspect ratio preserved)", img.getSize(), img_width, img_height)
             
             # Add image to story
             story.append(Image(image_buffer, width=img_width, height=img_height))
             story.append(Spacer(1, 0.2*inch))
             
-            print(f"✅ Successfully added {'GIF (converted)' if is_gif else 'base64'} image: {img_data.get('title', 'Visual Element')}")
+            logger.debug("✅ Successfully added %s image: %s", 'GIF (converted)' if is_gif else 'base64', img_data.get('title', 'Visual Element'))
             
         except Exception as e:
-            print(f"❌ Failed to add base64 image: {e}")
+            logger.warning("❌ Failed to add base64 image: %s", e)
             # Fallback to text description
-            story.append(Paragraph(f"[Image: {img_data.get('title', 'Visual Element')}]", styles['content']))
+            story.append(_paragraph(f"[Image: {img_data.get('title', 'Visual Element')}]", styles['content']))
     
     def _add_url_image(self, story: List, img_data: Dict[str, Any], styles: Dict[str, Any]):
         """Add external URL image from training data to PDF"""
         try:
-            import requests
             import io
             from reportlab.lib.utils import ImageReader
             from reportlab.platypus import Image
@@ -624,12 +1064,19 @@ class PDFGenerator:
             if not image_url:
                 raise ValueError("No image_url provided")
             
-            print(f"🌐 Downloading image from: {image_url}")
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
+            if img_data.get('prefetch_failed'):
+                raise ValueError(f"Could not download image from {image_url}")
+            
+            image_bytes = img_data.get('prefetched_image')
+            if image_bytes is None:
+                # Not prefetched: download inline
+                logger.debug("🌐 Downloading image from: %s", image_url)
+                response = self._get_http_client().get(image_url, timeout=10)
+                response.raise_for_status()
+                image_bytes = response.content
             
             # Create image buffer
-            image_buffer = io.BytesIO(response.content)
+            image_buffer = io.BytesIO(image_bytes)
             
             # Create image reader
             img = ImageReader(image_buffer)
@@ -644,14 +1091,14 @@ class PDFGenerator:
             story.append(Image(image_buffer, width=img_width, height=img_height))
             story.append(Spacer(1, 0.2*inch))
             
-            print(f"✅ Successfully added URL image: {img_data.get('title', 'Visual Element')}")
+            logger.debug("✅ Successfully added URL image: %s", img_data.get('title', 'Visual Element'))
             
         except Exception as e:
-            print(f"❌ Failed to add URL image: {e}")
+            logger.warning("❌ Failed to add URL image: %s", e)
             # Fallback to text description with URL
-            story.append(Paragraph(f"[Image: {img_data.get('title', 'Visual Element')}]", styles['content']))
+            story.append(_paragraph(f"[Image: {img_data.get('title', 'Visual Element')}]", styles['content']))
             if img_data.get('image_url'):
-                story.append(Paragraph(f"URL: {img_data.get('image_url')}", styles['content']))
+                story.append(_paragraph(f"URL: {img_data.get('image_url')}", styles['content']))
     
     def _add_chart_visual(self, story: List, img_data: Dict[str, Any], styles: Dict[str, Any]):
         """Add synthetic chart visual to PDF"""
@@ -659,36 +1106,31 @@ class PDFGenerator:
             data = img_data['data']
             if isinstance(data, dict):
                 # Create a bar chart
-                print(f"🎨 Creating chart for {img_data.get('title', 'Chart')} with data: {data}")
+                logger.debug("🎨 Creating chart for %s with data: %s", img_data.get('title', 'Chart'), data)
+                # Stringify the data once for both the text line and the table fallback
+                pairs = [(str(k), str(v)) for k, v in data.items()]
+                
                 # Always add a text representation first
-                data_text = f"📊 Chart Data: {', '.join([f'{k}: {v}' for k, v in data.items()])}"
-                story.append(Paragraph(data_text, styles['content']))
+                data_text = "📊 Chart Data: " + ", ".join([f"{k}: {v}" for k, v in pairs])
+                story.append(_paragraph(data_text, styles['content']))
                 
                 # Try to create chart
                 chart = self._create_bar_chart(data, img_data.get('title', 'Chart'))
                 if chart:
-                    print(f"✅ Chart created successfully for {img_data.get('title', 'Chart')}")
+                    logger.debug("✅ Chart created successfully for %s", img_data.get('title', 'Chart'))
                     story.append(chart)
                     story.append(Spacer(1, 0.2*inch))  # Add space after chart
                 else:
-                    print(f"❌ Chart creation failed for {img_data.get('title', 'Chart')}, using table fallback")
+                    logger.warning("❌ Chart creation failed for %s, using table fallback", img_data.get('title', 'Chart'))
                     # Fallback to table if chart creation fails
-                    table_data = [['Category', 'Value']] + [[str(k), str(v)] for k, v in data.items()]
+                    table_data = [['Category', 'Value']]
+                    table_data.extend([k, v] for k, v in pairs)
                     table = Table(table_data)
-                    table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, 0), 14),
-                        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                    ]))
+                    table.setStyle(_FALLBACK_TABLE_STYLE)
                     story.append(table)
         except Exception as e:
-            print(f"❌ Failed to add chart visual: {e}")
-            story.append(Paragraph(f"[Chart: {img_data.get('title', 'Visual Element')}]", styles['content']))
+            logger.warning("❌ Failed to add chart visual: %s", e)
+            story.append(_paragraph(f"[Chart: {img_data.get('title', 'Visual Element')}]", styles['content']))
     
     def _add_synthetic_visual(self, story: List, img_data: Dict[str, Any], styles: Dict[str, Any]):
         """Add synthetic visual element (infographic, icon, steps) to PDF"""
@@ -697,67 +1139,65 @@ class PDFGenerator:
             title = img_data.get('title', 'Visual Element')
             data = img_data.get('data', {})
             
-            if visual_type == 'infographic':
-                # Create a visual list with emoji icons
-                story.append(Paragraph(f"📊 {title}", styles['slide_title']))
-                if isinstance(data, dict):
-                    for key, value in data.items():
-                        story.append(Paragraph(f"• {key}: {value}", styles['content']))
-                story.append(Spacer(1, 0.1*inch))
-                
-            elif visual_type == 'icon':
-                # Create icon representation
-                icon = data.get('icon', '📊')
-                concept = data.get('concept', 'concept')
-                story.append(Paragraph(f"{icon} {title}", styles['slide_title']))
-                story.append(Paragraph(f"Concept: {concept}", styles['content']))
-                story.append(Spacer(1, 0.1*inch))
-                
-            elif visual_type == 'steps':
-                # Create step-by-step visual
-                story.append(Paragraph(f"📋 {title}", styles['slide_title']))
-                if isinstance(data, dict):
-                    for step, description in data.items():
-                        story.append(Paragraph(f"{step}: {description}", styles['content']))
-                story.append(Spacer(1, 0.1*inch))
-                
-            elif visual_type == 'tech_stack':
-                # Create technology stack visual
-                story.append(Paragraph(f"🔧 {title}", styles['slide_title']))
-                if isinstance(data, dict):
-                    for tech_key, tech_value in data.items():
-                        story.append(Paragraph(f"• {tech_value}", styles['content']))
-                story.append(Spacer(1, 0.1*inch))
-                
-            elif visual_type == 'innovation':
-                # Create innovation visual
-                story.append(Paragraph(f"💡 {title}", styles['slide_title']))
-                if isinstance(data, dict):
-                    for innovation_key, innovation_value in data.items():
-                        story.append(Paragraph(f"• {innovation_value}", styles['content']))
-                story.append(Spacer(1, 0.1*inch))
-                
-            else:
-                # Generic visual element
-                story.append(Paragraph(f"📊 {title}", styles['slide_title']))
-                if isinstance(data, dict):
-                    for key, value in data.items():
-                        story.append(Paragraph(f"• {key}: {value}", styles['content']))
-                story.append(Spacer(1, 0.1*inch))
-                
-            print(f"✅ Successfully added synthetic visual: {title} (type: {visual_type})")
+            renderer = self._visual_renderers.get(visual_type, self._render_generic_visual)
+            renderer(story, title, data, styles)
+            story.append(Spacer(1, 0.1*inch))
+            
+            logger.debug("✅ Successfully added synthetic visual: %s (type: %s)", title, visual_type)
             
         except Exception as e:
-            print(f"❌ Failed to add synthetic visual: {e}")
-            story.append(Paragraph(f"[Visual: {img_data.get('title', 'Visual Element')}]", styles['content']))
+            logger.warning("❌ Failed to add synthetic visual: %s", e)
+            story.append(_paragraph(f"[Visual: {img_data.get('title', 'Visual Element')}]", styles['content']))
+    
+    def _render_infographic(self, story: List, title: str, data: Any, styles: Dict[str, Any]):
+        """Create a visual list with emoji icons"""
+        story.append(_paragraph(f"📊 {title}", styles['slide_title']))
+        if isinstance(data, dict):
+            content_style = styles['content']
+            story.extend(_paragraph(f"• {key}: {value}", content_style) for key, value in data.items())
+    
+    def _render_icon(self, story: List, title: str, data: Any, styles: Dict[str, Any]):
+        """Create icon representation"""
+        icon = data.get('icon', '📊')
+        concept = data.get('concept', 'concept')
+        story.append(_paragraph(f"{icon} {title}", styles['slide_title']))
+        story.append(_paragraph(f"Concept: {concept}", styles['content']))
+    
+    def _render_steps(self, story: List, title: str, data: Any, styles: Dict[str, Any]):
+        """Create step-by-step visual"""
+        story.append(_paragraph(f"📋 {title}", styles['slide_title']))
+        if isinstance(data, dict):
+            content_style = styles['content']
+            story.extend(_paragraph(f"{step}: {description}", content_style) for step, description in data.items())
+    
+    def _render_tech_stack(self, story: List, title: str, data: Any, styles: Dict[str, Any]):
+        """Create technology stack visual"""
+        story.append(_paragraph(f"🔧 {title}", styles['slide_title']))
+        if isinstance(data, dict):
+            content_style = styles['content']
+            story.extend(_paragraph(f"• {tech_value}", content_style) for tech_value in data.values())
+    
+    def _render_innovation(self, story: List, title: str, data: Any, styles: Dict[str, Any]):
+        """Create innovation visual"""
+        story.append(_paragraph(f"💡 {title}", styles['slide_title']))
+        if isinstance(data, dict):
+            content_style = styles['content']
+            story.extend(_paragraph(f"• {innovation_value}", content_style) for innovation_value in data.values())
+    
+    def _render_generic_visual(self, story: List, title: str, data: Any, styles: Dict[str, Any]):
+        """Generic visual element: title plus its data as key/value bullets"""
+        story.append(_paragraph(f"📊 {title}", styles['slide_title']))
+        if isinstance(data, dict):
+            content_style = styles['content']
+            story.extend(_paragraph(f"• {key}: {value}", content_style) for key, value in data.items())
 
-    def _generate_ai_content(self, slide_data: Dict[str, Any], request_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_ai_content(self, slide_data: Slide, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate AI content (high cost - only when necessary)"""
         # This would use AI to generate content, but for cost optimization
         # we'll return the original content with minor enhancements
         return {
-            'title': slide_data.get('title', ''),
-            'content': slide_data.get('content', '')
+            'title': slide_data.title or '',
+            'content': slide_data.content
         }
     
     def _create_formatted_paragraph(self, text: str, formatting: Dict[str, Any], styles: Dict[str, Any]) -> Paragraph:
@@ -772,7 +1212,7 @@ class PDFGenerator:
             
             # Font attributes
             if font_format.get('name'):
-                style_attrs['fontName'] = font_format['name']
+                style_attrs['fontName'] = _resolve_font(font_format['name'])
             if font_format.get('size'):
                 style_attrs['fontSize'] = font_format['size']
             if font_format.get('bold'):
@@ -782,61 +1222,157 @@ class PDFGenerator:
             
             # Color handling
             if font_format.get('color'):
-                color_str = font_format['color']
-                if 'RGBColor(' in color_str:
-                    # Extract RGB values
-                    try:
-                        rgb_values = color_str[9:-1].split(', ')
-                        if len(rgb_values) == 3:
-                            r, g, b = map(int, rgb_values)
-                            style_attrs['textColor'] = HexColor(f'#{r:02x}{g:02x}{b:02x}')
-                    except:
-                        pass
+                match = _RGB_RE.match(font_format['color'])
+                if match:
+                    r, g, b = int(match[1]), int(match[2]), int(match[3])
+                    style_attrs['textColor'] = HexColor(f'#{r:02x}{g:02x}{b:02x}')
             
             # Paragraph alignment
-            if para_format.get('alignment'):
-                alignment_map = {
-                    'PP_ALIGN.LEFT': TA_LEFT,
-                    'PP_ALIGN.CENTER': TA_CENTER,
-                    'PP_ALIGN.RIGHT': TA_RIGHT,
-                    'PP_ALIGN.JUSTIFY': TA_LEFT  # ReportLab doesn't have justify
-                }
-                if para_format['alignment'] in alignment_map:
-                    style_attrs['alignment'] = alignment_map[para_format['alignment']]
-            
-            # Create custom style if we have formatting
+            if para_format.get('alignment') in ALIGNMENT_MAP:
+                style_attrs['alignment'] = ALIGNMENT_MAP[para_format['alignment']]
+            
+            # Create custom style if we have formatting (shared across slides with the same formatting)
             if style_attrs:
-                custom_style = ParagraphStyle(
-                    'CustomFormatted',
-                    parent=styles['content'],
-                    **style_attrs
-                )
-                return Paragraph(text, custom_style)
+                custom_style = _formatted_style(styles['content'], tuple(sorted(style_attrs.items())))
+                return _paragraph(text, custom_style)
             else:
-                return Paragraph(text, styles['content'])
+                return _paragraph(text, styles['content'])
                 
         except Exception as e:
-            print(f"⚠️ Error creating formatted paragraph: {e}")
-            return Paragraph(text, styles['content'])
+            logger.warning("⚠️ Error creating formatted paragraph: %s", e)
+            return _paragraph(text, styles['content'])
     
     async def _generate_preview_images(self, filepath: str, presentation_id: str) -> List[str]:
-        """Generate preview images for the PDF presentation"""
+        """Render JPEG thumbnails of the first pages of the PDF; returns their file paths (or s3:// URLs)
+        
+        Renders are cached on disk per (presentation id, PDF mtime), so rebuilding an unchanged
+        presentation reuses the previous thumbnails instead of rasterizing again.
+        """
         try:
-            # This would integrate with a service to convert PDF to images
-            # For now, return placeholder URLs
-            preview_urls = []
+            preview_root = os.path.join(self.output_dir, 'previews')
+            loop = asyncio.get_running_loop()
+            
+            def cached_previews() -> Tuple[str, Optional[List[str]]]:
+                # Cache directory for this version of the PDF, plus whatever was already rendered into it
+                cache_key = hashlib.sha1(f"{presentation_id}:{os.stat(filepath).st_mtime_ns}".encode('utf-8')).hexdigest()
+                cache_dir = os.path.join(preview_root, cache_key)
+                if PREVIEW_BUCKET:
+                    try:
+                        with open(os.path.join(cache_dir, 'urls.json')) as f:
+                            return cache_dir, json.load(f)
+                    except (OSError, ValueError):
+                        pass
+                try:
+                    names = sorted((name for name in os.listdir(cache_dir) if name.endswith('.jpg')), key=lambda name: int(name[:-4]))
+                except OSError:
+                    return cache_dir, None
+                return cache_dir, [os.path.join(cache_dir, name) for name in names] or None
+            
+            def render(cache_dir: str) -> List[str]:
+                # pdf2image needs poppler on the host, so only import it (and PIL) when previews are built
+                from pdf2image import convert_from_path
+                from PIL import Image as PILImage
+                
+                # Render into a scratch directory and rename it into place once complete
+                self._ensure_dir(preview_root)
+                render_dir = tempfile.mkdtemp(prefix='render_', dir=preview_root)
+                try:
+                    with tempfile.TemporaryDirectory(prefix='pages_', dir=PREVIEW_SCRATCH_DIR) as page_dir:
+                        # Poppler renders pages on several threads; JPEG at screen resolution keeps files small
+                        paths = convert_from_path(
+                            filepath,
+                            dpi=72,
+                            first_page=1,
+                            last_page=PREVIEW_PAGES,
+                            thread_count=os.cpu_count() or 1,
+                            fmt='jpeg',
+                            use_pdftocairo=True,
+                            output_folder=page_dir,
+                            output_file=presentation_id,
+                            paths_only=True
+                        )
+                        for index, path in enumerate(paths):
+                            with PILImage.open(path) as image:
+                                # draft() lets the JPEG decoder downscale while decoding instead of after
+                                image.draft('RGB', PREVIEW_SIZE)
+                                image.thumbnail(PREVIEW_SIZE)
+                                image.save(os.path.join(render_dir, f"{index}.jpg"), 'JPEG', quality=80, optimize=True)
+                    try:
+                        os.rename(render_dir, cache_dir)
+                    except OSError:
+                        # A concurrent render of the same version got there first
+                        shutil.rmtree(render_dir, ignore_errors=True)
+                    return [os.path.join(cache_dir, f"{index}.jpg") for index in range(len(paths))]
+                except Exception:
+                    shutil.rmtree(render_dir, ignore_errors=True)
+                    raise
             
-            # In a real implementation, you would:
-            # 1. Convert PDF to images using a service like pdf2image or cloud API
-            # 2. Upload images to cloud storage
-            # 3. Return the URLs
+            cache_dir, cached = await loop.run_in_executor(None, cached_previews)
+            if cached and (not PREVIEW_BUCKET or cached[0].startswith('s3://')):
+                logger.debug("🖼️ Reusing cached previews for %s", presentation_id)
+                return cached
             
-            return preview_urls
+            preview_paths = cached or await loop.run_in_executor(_PDF_POOL, render, cache_dir)
+            if PREVIEW_BUCKET and preview_paths:
+                preview_urls = await self._upload_preview_images(preview_paths, presentation_id)
+                
+                def write_urls():
+                    with open(os.path.join(cache_dir, 'urls.json'), 'w') as f:
+                        json.dump(preview_urls, f)
+                
+                await asyncio.to_thread(write_urls)
+                return preview_urls
+            return preview_paths
             
         except Exception as e:
-            logger.error(f"Error generating preview images: {e}")
+            logger.error("Error generating preview images: %s", e)
             return []
     
+    def _get_s3_client(self):
+        """S3 client for preview uploads and presigning, created on first use"""
+        if self._s3_client is None:
+            self._s3_client = boto3.client(
+                's3',
+                region_name=os.getenv('AWS_REGION', 'ap-south-1'),
+                config=Config(max_pool_connections=PREVIEW_UPLOAD_CONCURRENCY)
+            )
+        return self._s3_client
+    
+    async def _upload_preview_images(self, preview_paths: List[str], presentation_id: str) -> List[str]:
+        """Upload preview images to the preview bucket concurrently; returns their s3:// references in page order"""
+        s3_client = self._get_s3_client()
+        
+        def upload(index: int, path: str) -> str:
+            key = f"previews/{presentation_id}/{index}.jpg"
+            with open(path, 'rb') as f:
+                s3_client.put_object(Bucket=PREVIEW_BUCKET, Key=key, Body=f, ContentType='image/jpeg')
+            return f"s3://{PREVIEW_BUCKET}/{key}"
+        
+        # One put per page in flight at once (bounded by the upload pool) instead of one after another
+        loop = asyncio.get_running_loop()
+        return list(await asyncio.gather(
+            *[loop.run_in_executor(_preview_upload_pool, upload, i, path) for i, path in enumerate(preview_paths)]
+        ))
+    
+    def preview_urls(self, presentation_id: str, previews: List[str]) -> List[str]:
+        """Fetchable URLs for stored preview references (s3:// objects or local files)
+        
+        Uploaded previews get a fresh presigned GET URL on every call, so nothing that expires
+        is stored; local previews are served by the app's previews/{page} endpoint.
+        """
+        urls = []
+        for page, preview in enumerate(previews):
+            if preview.startswith('s3://'):
+                bucket, _, key = preview[len('s3://'):].partition('/')
+                urls.append(self._get_s3_client().generate_presigned_url(
+                    'get_object',
+                    Params={'Bucket': bucket, 'Key': key},
+                    ExpiresIn=PREVIEW_URL_TTL
+                ))
+            else:
+                urls.append(f"/presentations/{presentation_id}/previews/{page}")
+        return urls
+    
     def get_presentation_info(self, filepath: str) -> Dict[str, Any]:
         """Get information about the generated PDF presentation"""
         try:
@@ -847,5 +1383,5 @@ class PDFGenerator:
             }
             
         except Exception as e:
-            logger.error(f"Error getting PDF presentation info: {e}")
+            logger.error("Error getting PDF presentation info: %s", e)
             return {}
@@ -3,96 +3,315 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+from pptx.parts.image import Image as PptxImage, ImagePart
 import os
-import uuid
 import base64
 import io
-from typing import List, Dict, Any, Optional
+import zipfile
+import asyncio
+from collections import defaultdict
+from urllib.parse import urlparse, quote
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, BinaryIO
 import logging
+import aiohttp
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from PIL import Image as PILImage
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent image downloads per deck, and per origin so one CDN isn't hammered into rate limiting
+IMAGE_PREFETCH_CONCURRENCY = 8
+IMAGE_PREFETCH_PER_HOST = 4
+
+# Write buffer for saving decks; coalesces python-pptx's many small zip entry writes
+PPTX_WRITE_BUFFER = 1024 * 1024
+
+# With a bucket configured, decks are uploaded straight from memory; a local copy is only written on request
+PRESENTATION_BUCKET = os.getenv('PRESENTATION_BUCKET')
+KEEP_LOCAL_PRESENTATIONS = os.getenv('KEEP_LOCAL_PRESENTATIONS', '0') == '1'
+# Download links are presigned per request for this long (never stored, since they expire)
+PRESENTATION_URL_TTL = int(os.getenv('PRESENTATION_URL_TTL', 3600))
+PPTX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+MB = 1024 * 1024
+
+def _presentation_key(presentation_id: str) -> str:
+    """Bucket key of an uploaded deck (derived from the id alone, so a download needs no lookup)"""
+    return f"presentations/{presentation_id}.pptx"
+
+# Exact-copy slide geometry (left, top, width, height) and text styles, computed once instead of per slide
+TITLE_BOX = (Inches(0.5), Inches(0.5), Inches(9), Inches(1))
+CONTENT_BOX = (Inches(0.5), Inches(4), Inches(9), Inches(3))
+SOURCE_BOX = (Inches(0.5), Inches(7), Inches(9), Inches(0.5))
+TITLE_FONT_SIZE = Pt(24)
+CONTENT_FONT_SIZE = Pt(14)
+SOURCE_FONT_SIZE = Pt(10)
+TITLE_COLOR = RGBColor(0, 51, 102)
+MUTED_GRAY = RGBColor(128, 128, 128)
+
+# Image formats that are already compressed; deflating them again costs CPU for no size gain
+PRECOMPRESSED_MEDIA_EXTS = frozenset(('png', 'jpg', 'jpeg', 'gif'))
+
+class _FastZipPkgWriter(_ZipPkgWriter):
+    """Zip writer that stores already-compressed media as-is and deflates XML parts at level 1"""
+    
+    def write(self, pack_uri, blob: bytes) -> None:
+        if pack_uri.ext.lower() in PRECOMPRESSED_MEDIA_EXTS:
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zipf.writestr(pack_uri.membername, blob, compresslevel=1)
+
+class _FastPackageWriter(PackageWriter):
+    """python-pptx's PackageWriter, writing through _FastZipPkgWriter"""
+    
+    def _write(self) -> None:
+        with _FastZipPkgWriter(self._pkg_file) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+def _save_presentation(prs: Presentation, pkg_file):
+    """Equivalent of prs.save(pkg_file) with cheaper compression"""
+    package = prs.part.package
+    _FastPackageWriter.write(pkg_file, package._rels, tuple(package.iter_parts()))
+
+# Deck builds are synchronous python-pptx/lxml work; run them here so the event loop stays free
+_PPTX_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='pptx-build')
+
+@lru_cache(maxsize=1)
+def _default_template_bytes() -> bytes:
+    """The bundled empty python-pptx template, loaded from package data once per process"""
+    buffer = io.BytesIO()
+    Presentation().save(buffer)
+    return buffer.getvalue()
+
 class PPTXGenerator:
     def __init__(self):
         self.output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'generated_presentations')
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._s3_client = None
+        self._transfer_config = TransferConfig(
+            multipart_threshold=8 * MB,
+            multipart_chunksize=8 * MB,
+            max_concurrency=8,
+            use_threads=True
+        )
         self.ensure_output_dir()
     
     def ensure_output_dir(self):
         """Ensure output directory exists"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
     
     async def generate_presentation(
         self,
         slides: List[Dict[str, Any]],
         presentation_id: str,
-        request_data: Dict[str, Any]
+        request_data: Dict[str, Any],
+        write_local_copy: bool = False
     ) -> Dict[str, Any]:
-        """Generate a PPTX presentation from selected slides"""
+        """Generate a PPTX presentation from selected slides
+        
+        With write_local_copy, the deck is also saved to the output directory even when it is uploaded
+        to the presentation bucket (e.g. so previews can be rendered from it); see 'localPath'.
+        """
         
         try:
-            print(f"🎨 PPTX PRESENTATION GENERATOR STARTED")
-            print(f"   - Presentation ID: {presentation_id}")
-            print(f"   - Total Slides: {len(slides)}")
-            print(f"   - Customer: {request_data.get('customer', 'N/A')}")
-            print(f"   - Industry: {request_data.get('industry', 'N/A')}")
-            print(f"   - Style: {request_data.get('style', 'N/A')}")
+            logger.info(
+                "🎨 PPTX presentation generator started: id=%s slides=%d customer=%s industry=%s style=%s",
+                presentation_id, len(slides), request_data.get('customer', 'N/A'),
+                request_data.get('industry', 'N/A'), request_data.get('style', 'N/A')
+            )
             
             # Create PPTX document
             filename = f"{presentation_id}_{request_data['customer'].replace(' ', '_')}.pptx"
             filepath = os.path.join(self.output_dir, filename)
             
-            # Create new presentation
-            prs = Presentation()
-            
-            # Add title slide
-            self._add_title_slide(prs, request_data)
+            # Download every URL image up front, concurrently, instead of one blocking request per slide
+            prefetched = await self._prefetch_images(slides)
             
-            # Add content slides
-            for i, slide_data in enumerate(slides):
-                action = slide_data.get('action', 'copy_exact')
-                print(f"📄 PROCESSING SLIDE {i+1}/{len(slides)}")
-                print(f"   - Action: {action}")
-                print(f"   - Source: {slide_data.get('source_title', 'N/A')}")
-                print(f"   - Type: {slide_data.get('slide_type', 'N/A')}")
-                
-                if action == 'copy_exact':
-                    print(f"   - 🔄 Copying exact content (0 AI tokens)")
-                    self._add_exact_copy_slide(prs, slide_data, i + 1)
-                elif action == 'minor_enhancement':
-                    print(f"   - ✨ Minor enhancement (~50 AI tokens)")
-                    self._add_enhanced_slide(prs, slide_data, i + 1, request_data)
-                else:  # full_generation
-                    print(f"   - 🤖 Full AI generation (~200 AI tokens)")
-                    self._add_ai_generated_slide(prs, slide_data, i + 1, request_data)
-                
-                print(f"   - ✅ Slide {i+1} completed")
-                print()
-            
-            # Add conclusion slide
-            self._add_conclusion_slide(prs, request_data)
-            
-            # Save presentation
-            prs.save(filepath)
+            loop = asyncio.get_running_loop()
+            keep_local = not PRESENTATION_BUCKET or KEEP_LOCAL_PRESENTATIONS or write_local_copy
+            buffer = await loop.run_in_executor(
+                _PPTX_POOL, self._build_pptx, slides, request_data, prefetched, filepath if keep_local else None
+            )
             
-            print(f"✅ PPTX presentation saved: {filepath}")
-            
-            return {
+            result = {
                 'filepath': filepath,
                 'filename': filename,
                 'slideCount': len(slides) + 2,  # +2 for title and conclusion
                 'status': 'completed'
             }
+            if keep_local:
+                result['localPath'] = filepath
+            
+            if buffer is not None:
+                key = _presentation_key(presentation_id)
+                await loop.run_in_executor(None, self._upload_presentation, buffer, key, filename)
+                if not KEEP_LOCAL_PRESENTATIONS:
+                    result['filepath'] = f"s3://{PRESENTATION_BUCKET}/{key}"
+            
+            logger.info("✅ PPTX presentation saved: %s", result['filepath'])
+            
+            return result
             
         except Exception as e:
-            print(f"❌ Error generating PPTX presentation: {e}")
+            logger.error("❌ Error generating PPTX presentation: %s", e)
             raise e
     
-    def _add_title_slide(self, prs: Presentation, request_data: Dict[str, Any]):
+    def _build_pptx(self, slides: List[Dict[str, Any]], request_data: Dict[str, Any], prefetched: Dict[str, bytes], filepath: Optional[str]) -> Optional[io.BytesIO]:
+        """Build the whole deck (runs on the build pool)
+        
+        Saves it to filepath, or, when a presentation bucket is configured, returns it in memory for
+        upload (also writing filepath if one is given).
+        """
+        # Create new presentation
+        prs = Presentation(io.BytesIO(_default_template_bytes()))
+        # prs.slide_layouts re-walks the master's layout list on every access, so resolve it once per deck
+        layouts = tuple(prs.slide_layouts)
+        
+        # Add title slide
+        self._add_title_slide(prs, layouts, request_data)
+        
+        # Image parts already embedded in this deck, by SHA-1 of their bytes
+        image_parts: Dict[str, ImagePart] = {}
+        
+        # Add content slides
+        for i, slide_data in enumerate(slides):
+            action = slide_data.get('action', 'copy_exact')
+            logger.debug(
+                "📄 slide %d/%d action=%s src=%s type=%s",
+                i + 1, len(slides), action, slide_data.get('source_title'), slide_data.get('slide_type')
+            )
+            
+            if action == 'copy_exact':
+                self._add_exact_copy_slide(prs, layouts, slide_data, i + 1, prefetched, image_parts)
+            elif action == 'minor_enhancement':
+                self._add_enhanced_slide(prs, layouts, slide_data, i + 1, request_data, prefetched, image_parts)
+            else:  # full_generation
+                self._add_ai_generated_slide(prs, layouts, slide_data, i + 1, request_data, prefetched, image_parts)
+        
+        # Add conclusion slide
+        self._add_conclusion_slide(prs, layouts, request_data)
+        
+        if not PRESENTATION_BUCKET:
+            self._write_atomic(filepath, lambda f: _save_presentation(prs, f))
+            return None
+        
+        # Serialize once; the same buffer feeds the upload (and the optional local copy)
+        buffer = io.BytesIO()
+        _save_presentation(prs, buffer)
+        if filepath is not None:
+            self._write_atomic(filepath, lambda f: f.write(buffer.getbuffer()))
+        buffer.seek(0)
+        return buffer
+    
+    @staticmethod
+    def _write_atomic(filepath: str, write: Callable[[BinaryIO], Any]):
+        """Write to a temp file, then swap it in so readers never see a partial deck"""
+        temp_filepath = f"{filepath}.tmp"
+        try:
+            with open(temp_filepath, 'wb', buffering=PPTX_WRITE_BUFFER) as f:
+                write(f)
+            os.replace(temp_filepath, filepath)
+        except Exception:
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+            raise
+    
+    def _get_s3_client(self):
+        """S3 client for the presentation bucket, created on first use"""
+        if self._s3_client is None:
+            self._s3_client = boto3.client(
+                's3',
+                region_name=os.getenv('AWS_REGION', 'ap-south-1'),
+                config=Config(max_pool_connections=16)
+            )
+        return self._s3_client
+    
+    def _upload_presentation(self, buffer: io.BytesIO, key: str, filename: str):
+        """Stream an in-memory deck to the presentation bucket, to be downloaded under filename"""
+        self._get_s3_client().upload_fileobj(
+            buffer, PRESENTATION_BUCKET, key,
+            ExtraArgs={
+                'ContentType': PPTX_CONTENT_TYPE,
+                'ContentDisposition': f"attachment; filename*=UTF-8''{quote(filename)}"
+            },
+            Config=self._transfer_config
+        )
+    
+    def get_download_url(self, presentation_id: str) -> Optional[str]:
+        """Presign a download of an uploaded deck (minted per request, since presigned URLs expire)
+        
+        Returns None when no presentation bucket is configured or the deck isn't in it.
+        """
+        if not PRESENTATION_BUCKET:
+            return None
+        s3_client = self._get_s3_client()
+        key = _presentation_key(presentation_id)
+        try:
+            s3_client.head_object(Bucket=PRESENTATION_BUCKET, Key=key)
+        except ClientError:
+            return None
+        return s3_client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': PRESENTATION_BUCKET, 'Key': key},
+            ExpiresIn=PRESENTATION_URL_TTL
+        )
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Shared aiohttp session for image prefetches"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300)
+            )
+        return self._http_session
+    
+    async def close(self):
+        """Close the image download session"""
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+    
+    async def _prefetch_images(self, slides: List[Dict[str, Any]]) -> Dict[str, bytes]:
+        """Download every URL image in the deck concurrently; returns {url: bytes} for the ones that succeeded"""
+        urls = list(dict.fromkeys(
+            img_data['image_url']
+            for slide_data in slides
+            for img_data in slide_data.get('images', []) or []
+            if isinstance(img_data, dict) and img_data.get('image_url')
+            and not (img_data.get('image_data') or img_data.get('image_blob'))
+        ))
+        if not urls:
+            return {}
+        
+        logger.info("🌐 Prefetching %d slide images", len(urls))
+        semaphore = asyncio.Semaphore(IMAGE_PREFETCH_CONCURRENCY)
+        host_semaphores = defaultdict(lambda: asyncio.Semaphore(IMAGE_PREFETCH_PER_HOST))
+        session = self._get_http_session()
+        
+        async def fetch(url: str) -> Optional[bytes]:
+            async with host_semaphores[urlparse(url).netloc], semaphore:
+                try:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return await response.read()
+                except Exception as e:
+                    logger.warning("❌ Failed to prefetch image %s: %s", url, e)
+                    return None
+        
+        results = await asyncio.gather(*[fetch(url) for url in urls])
+        return {url: content for url, content in zip(urls, results) if content}
+    
+    def _add_title_slide(self, prs: Presentation, layouts: tuple, request_data: Dict[str, Any]):
         """Add title slide to presentation"""
-        slide_layout = prs.slide_layouts[0]  # Title slide layout
+        slide_layout = layouts[0]  # Title slide layout
         slide = prs.slides.add_slide(slide_layout)
         
         # Set title
@@ -103,44 +322,37 @@ class PPTXGenerator:
         subtitle = slide.placeholders[1]
         subtitle.text = f"{request_data.get('useCase', 'Presentation')}\n\nGenerated by AI Presentation Generator"
         
-        print(f"📄 Added title slide: {title.text}")
+        logger.debug("📄 Added title slide: %s", title.text)
     
-    def _add_exact_copy_slide(self, prs: Presentation, slide_data: Dict[str, Any], slide_number: int):
+    def _add_exact_copy_slide(self, prs: Presentation, layouts: tuple, slide_data: Dict[str, Any], slide_number: int, prefetched: Optional[Dict[str, bytes]] = None, image_parts: Optional[Dict[str, ImagePart]] = None):
         """Add slide by copying exact content from training data with all visual elements"""
-        print(f"📄 EXACT COPY: Processing slide {slide_number}")
-        
         # Use blank layout for maximum flexibility
-        slide_layout = prs.slide_layouts[6]  # Blank layout
+        slide_layout = layouts[6]  # Blank layout
         slide = prs.slides.add_slide(slide_layout)
         
         # Add slide title
         title = slide_data.get('title', f'Slide {slide_number}')
         if title:
-            title_shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
+            title_shape = slide.shapes.add_textbox(*TITLE_BOX)
             title_frame = title_shape.text_frame
             title_frame.text = title
-            title_frame.paragraphs[0].font.size = Pt(24)
+            title_frame.paragraphs[0].font.size = TITLE_FONT_SIZE
             title_frame.paragraphs[0].font.bold = True
-            title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
+            title_frame.paragraphs[0].font.color.rgb = TITLE_COLOR
         
         # Add visual elements exactly as they were in training data
         images = slide_data.get('images', [])
-        print(f"📸 EXACT COPY: Slide {slide_number} has {len(images)} visual elements")
-        
         if images:
-            print(f"🎯 PROCESSING {len(images)} VISUAL ELEMENTS FOR EXACT COPY")
             for i, img_data in enumerate(images):
                 img_title = img_data.get('title', 'Visual Element')
-                print(f"🎨 EXACT COPY VISUAL: {img_title} (type: {img_data.get('type')})")
+                logger.debug("🎨 Slide %d visual: %s (type: %s)", slide_number, img_title, img_data.get('type'))
                 
                 if img_data.get('image_data') or img_data.get('image_blob'):
-                    print(f"📸 EXACT COPY BASE64 IMAGE: {img_title}")
-                    self._add_base64_image_to_slide(slide, img_data, i)
+                    self._add_base64_image_to_slide(slide, img_data, i, image_parts)
                 elif img_data.get('image_url'):
-                    print(f"🌐 EXACT COPY URL IMAGE: {img_title} - {img_data.get('image_url')}")
-                    self._add_url_image_to_slide(slide, img_data, i)
+                    self._add_url_image_to_slide(slide, img_data, i, prefetched, image_parts)
                 else:
-                    print(f"⚠️ EXACT COPY UNKNOWN TYPE: {img_title}")
+                    logger.debug("⚠️ Unknown visual type, adding placeholder: %s", img_title)
                     # Add placeholder text
                     text_shape = slide.shapes.add_textbox(Inches(0.5), Inches(2 + i * 1.5), Inches(9), Inches(1))
                     text_frame = text_shape.text_frame
@@ -153,59 +365,63 @@ class PPTXGenerator:
             content_text = '\n'.join([f"• {line.strip()}" for line in content_lines if line.strip()])
             
             if content_text:
-                text_shape = slide.shapes.add_textbox(Inches(0.5), Inches(4), Inches(9), Inches(3))
+                text_shape = slide.shapes.add_textbox(*CONTENT_BOX)
                 text_frame = text_shape.text_frame
                 text_frame.text = content_text
-                text_frame.paragraphs[0].font.size = Pt(14)
+                text_frame.paragraphs[0].font.size = CONTENT_FONT_SIZE
         
         # Add source attribution
-        source = slide_data.get('sourcePresentation', '')
-        if source:
-            source_shape = slide.shapes.add_textbox(Inches(0.5), Inches(7), Inches(9), Inches(0.5))
+        source = slide_data.get('sourcePresentation')
+        if source and str(source).strip():
+            source_shape = slide.shapes.add_textbox(*SOURCE_BOX)
             source_frame = source_shape.text_frame
             source_frame.text = f"Source: {source}"
-            source_frame.paragraphs[0].font.size = Pt(10)
+            source_frame.paragraphs[0].font.size = SOURCE_FONT_SIZE
             source_frame.paragraphs[0].font.italic = True
-            source_frame.paragraphs[0].font.color.rgb = RGBColor(128, 128, 128)
+            source_frame.paragraphs[0].font.color.rgb = MUTED_GRAY
+        
+        logger.debug("✅ Slide %d completed with %d visual elements", slide_number, len(images))
+    
+    def _add_picture(self, slide, image_bytes: bytes, left, top, width, height, image_parts: Optional[Dict[str, ImagePart]] = None):
+        """slide.shapes.add_picture from bytes, reusing this deck's image part when the same image was added before
+        
+        python-pptx also dedupes by SHA-1, but finds the match by walking every relationship in the
+        package on each call; the per-deck dict makes repeated images a single lookup.
+        """
+        if image_parts is None:
+            return slide.shapes.add_picture(io.BytesIO(image_bytes), left, top, width, height)
         
-        print(f"✅ EXACT COPY: Slide {slide_number} completed with {len(images)} visual elements")
+        image = PptxImage.from_blob(image_bytes)
+        image_part = image_parts.get(image.sha1)
+        if image_part is None:
+            image_part = ImagePart.new(slide.part.package, image)
+            image_parts[image.sha1] = image_part
+        rId = slide.part.relate_to(image_part, RT.IMAGE)
+        pic = slide.shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+        return slide.shapes._shape_factory(pic)
     
-    def _add_base64_image_to_slide(self, slide, img_data: Dict[str, Any], index: int):
+    def _add_base64_image_to_slide(self, slide, img_data: Dict[str, Any], index: int, image_parts: Optional[Dict[str, ImagePart]] = None):
         """Add base64-encoded image (including GIFs) to slide"""
         try:
-            print(f"📸 PROCESSING BASE64 IMAGE: {img_data.get('title', 'Visual Element')}")
-            
             # Check if it's a GIF
             is_gif = img_data.get('is_gif', False)
-            if is_gif:
-                print(f"🎬 Processing GIF image: {img_data.get('title', 'Visual Element')}")
             
             # Handle both 'image_data' (base64 string) and raw binary
             image_data_field = img_data.get('image_data') or img_data.get('image_blob')
             
             if not image_data_field:
-                print(f"❌ No image data found in: {img_data}")
+                logger.warning("❌ No image data found for: %s", img_data.get('title', 'Visual Element'))
                 return
             
             # Decode base64 image data
             if isinstance(image_data_field, str):
                 # Already base64 encoded
-                print(f"📸 Decoding base64 string (length: {len(image_data_field)})")
                 image_bytes = base64.b64decode(image_data_field)
             else:
                 # Raw bytes
-                print(f"📸 Using raw bytes (length: {len(image_data_field)})")
                 image_bytes = image_data_field
             
             # For PPTX, we can keep GIFs as GIFs (they're supported)
-            if is_gif:
-                print(f"🎬 Keeping GIF as animated in PPTX")
-            
-            # Save image to temporary file
-            import tempfile
-            temp_filename = os.path.join(tempfile.gettempdir(), f"temp_image_{uuid.uuid4()}.{'gif' if is_gif else 'png'}")
-            with open(temp_filename, 'wb') as f:
-                f.write(image_bytes)
             
             # Get original image dimensions and position from source data
             original_left = img_data.get('left', 0)
@@ -232,7 +448,7 @@ class PPTXGenerator:
                     width = width * scale_factor
                     height = height * scale_factor
                 
-                print(f"📸 Using original positioning: left={left:.2f}, top={top:.2f}, size={width:.2f}x{height:.2f}")
+                logger.debug("📸 Using original positioning: left=%s, top=%s, size=%sx%s", left, top, width, height)
             else:
                 # Fallback to grid layout
                 images_per_row = 2
@@ -244,40 +460,39 @@ class PPTXGenerator:
                 width = Inches(4)
                 height = Inches(2.5)
                 
-                print(f"📸 Using grid layout: left={left:.2f}, top={top:.2f}, size={width:.2f}x{height:.2f}")
+                logger.debug("📸 Using grid layout: left=%s, top=%s, size=%sx%s", left, top, width, height)
             
             # Add image to slide
-            slide.shapes.add_picture(temp_filename, left, top, width, height)
+            self._add_picture(slide, image_bytes, left, top, width, height, image_parts)
             
-            # Clean up temp file
-            os.remove(temp_filename)
-            
-            print(f"✅ Successfully added {'GIF' if is_gif else 'base64'} image: {img_data.get('title', 'Visual Element')}")
+            logger.debug("✅ Added %s image: %s", 'GIF' if is_gif else 'base64', img_data.get('title', 'Visual Element'))
             
         except Exception as e:
-            print(f"❌ Error adding base64 image: {e}")
+            logger.warning("❌ Error adding base64 image: %s", e)
     
-    def _add_url_image_to_slide(self, slide, img_data: Dict[str, Any], index: int):
+    def _add_url_image_to_slide(self, slide, img_data: Dict[str, Any], index: int, prefetched: Optional[Dict[str, bytes]] = None, image_parts: Optional[Dict[str, ImagePart]] = None):
         """Add image from URL to slide"""
         try:
-            import requests
-            
             image_url = img_data.get('image_url')
             if not image_url:
-                print(f"❌ No image URL found in: {img_data}")
+                logger.warning("❌ No image URL found for: %s", img_data.get('title', 'Visual Element'))
                 return
             
-            print(f"🌐 Downloading image from URL: {image_url}")
-            
-            # Download image
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            
-            # Save to temporary file
-            import tempfile
-            temp_filename = os.path.join(tempfile.gettempdir(), f"temp_url_image_{uuid.uuid4()}.png")
-            with open(temp_filename, 'wb') as f:
-                f.write(response.content)
+            if prefetched is not None:
+                image_bytes = prefetched.get(image_url)
+                if image_bytes is None:
+                    # Prefetch already failed for this URL; don't retry synchronously
+                    logger.warning("❌ Image was not downloaded: %s", image_url)
+                    return
+            else:
+                import requests
+                
+                logger.debug("🌐 Downloading image from URL: %s", image_url)
+                
+                # Download image
+                response = requests.get(image_url, timeout=10)
+                response.raise_for_status()
+                image_bytes = response.content
             
             # Calculate position
             images_per_row = 2
@@ -290,29 +505,26 @@ class PPTXGenerator:
             height = Inches(2)
             
             # Add image to slide
-            slide.shapes.add_picture(temp_filename, left, top, width, height)
-            
-            # Clean up temp file
-            os.remove(temp_filename)
+            self._add_picture(slide, image_bytes, left, top, width, height, image_parts)
             
-            print(f"✅ Successfully added URL image: {img_data.get('title', 'Visual Element')}")
+            logger.debug("✅ Added URL image: %s", img_data.get('title', 'Visual Element'))
             
         except Exception as e:
-            print(f"❌ Error adding URL image: {e}")
+            logger.warning("❌ Error adding URL image: %s", e)
     
-    def _add_enhanced_slide(self, prs: Presentation, slide_data: Dict[str, Any], slide_number: int, request_data: Dict[str, Any]):
+    def _add_enhanced_slide(self, prs: Presentation, layouts: tuple, slide_data: Dict[str, Any], slide_number: int, request_data: Dict[str, Any], prefetched: Optional[Dict[str, bytes]] = None, image_parts: Optional[Dict[str, ImagePart]] = None):
         """Add enhanced slide with minor AI improvements"""
         # For now, treat as exact copy
-        self._add_exact_copy_slide(prs, slide_data, slide_number)
+        self._add_exact_copy_slide(prs, layouts, slide_data, slide_number, prefetched, image_parts)
     
-    def _add_ai_generated_slide(self, prs: Presentation, slide_data: Dict[str, Any], slide_number: int, request_data: Dict[str, Any]):
+    def _add_ai_generated_slide(self, prs: Presentation, layouts: tuple, slide_data: Dict[str, Any], slide_number: int, request_data: Dict[str, Any], prefetched: Optional[Dict[str, bytes]] = None, image_parts: Optional[Dict[str, ImagePart]] = None):
         """Add AI-generated slide"""
         # For now, treat as exact copy
-        self._add_exact_copy_slide(prs, slide_data, slide_number)
+        self._add_exact_copy_slide(prs, layouts, slide_data, slide_number, prefetched, image_parts)
     
-    def _add_conclusion_slide(self, prs: Presentation, request_data: Dict[str, Any]):
+    def _add_conclusion_slide(self, prs: Presentation, layouts: tuple, request_data: Dict[str, Any]):
         """Add conclusion slide to presentation"""
-        slide_layout = prs.slide_layouts[0]  # Title slide layout
+        slide_layout = layouts[0]  # Title slide layout
         slide = prs.slides.add_slide(slide_layout)
         
         # Set title
@@ -322,5 +534,3 @@ class PPTXGenerator:
         # Set subtitle
         subtitle = slide.placeholders[1]
         subtitle.text = f"Questions & Discussion\n\n{request_data.get('customer', 'Client')} - {request_data.get('industry', 'Business')}"
-        
-        print(f"📄 Added conclusion slide")
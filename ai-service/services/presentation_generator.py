@@ -1,30 +1,160 @@
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Inches, Pt, Emu
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 import os
-import uuid
-from typing import List, Dict, Any, Optional
+import re
+import hashlib
+import shutil
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 from PIL import Image
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
+from xml.sax.saxutils import escape
 from .pdf_generator import PDFGenerator
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Slide images are resized in pixels at 96 DPI; 1 px = 9525 EMU
+IMAGE_DPI = 96
+EMU_PER_PIXEL = 914400 // IMAGE_DPI
+
+# PPTX -> PDF conversion for previews; a long-lived `unoconv --listener` avoids a LibreOffice cold start per deck
+SOFFICE_BIN = os.getenv('SOFFICE_BIN', 'soffice')
+UNOCONV_BIN = os.getenv('UNOCONV_BIN', 'unoconv')
+PREVIEW_CONVERT_TIMEOUT = int(os.getenv('PREVIEW_CONVERT_TIMEOUT', 120))
+
+# Per-slide shape geometry (left, top, width, height) and text styles, computed once instead of per slide
+QUOTE_BOX = (Inches(1), Inches(2), Inches(8), Inches(3))
+SLIDE_NUMBER_BOX = (Inches(9), Inches(7), Inches(1), Inches(0.5))
+SOURCE_BOX = (Inches(0.5), Inches(6.5), Inches(9), Inches(0.5))
+IMAGE_LEFT, IMAGE_TOP = Inches(1), Inches(2)
+EXTRACTED_IMAGE_WIDTH, EXTRACTED_IMAGE_HEIGHT = Inches(4), Inches(3)
+QUOTE_FONT_SIZE = Pt(24)
+SLIDE_NUMBER_FONT_SIZE = Pt(12)
+SOURCE_FONT_SIZE = Pt(8)
+MUTED_GRAY = RGBColor(128, 128, 128)
+
+# Control characters python-pptx escapes as _xHHHH_ in run text (tab and newline are kept)
+_CTRL_CHARS_RE = re.compile(r'[\x00-\x08\x0B-\x1F]')
+
+# Stored run colors of the form "RGBColor(r, g, b)"
+_RGB_RE = re.compile(r'RGBColor\((\d+),\s*(\d+),\s*(\d+)\)')
+
+# Stored paragraph alignment strings -> python-pptx alignment
+ALIGNMENT_MAP = {
+    'PP_ALIGN.LEFT': PP_ALIGN.LEFT,
+    'PP_ALIGN.CENTER': PP_ALIGN.CENTER,
+    'PP_ALIGN.RIGHT': PP_ALIGN.RIGHT,
+    'PP_ALIGN.JUSTIFY': PP_ALIGN.JUSTIFY
+}
+
+def _bullet_paragraph_xml(text: str) -> str:
+    """<a:p> markup equivalent to paragraph.text = text; paragraph.level = 0 (vertical tabs become line breaks)"""
+    if not text:
+        return '<a:p/>'
+    parts = ['<a:pPr/>']
+    for index, segment in enumerate(text.split('\v')):
+        if index:
+            parts.append('<a:br/>')
+        if segment:
+            segment = _CTRL_CHARS_RE.sub(lambda match: '_x%04X_' % ord(match.group()), segment)
+            parts.append(f'<a:r><a:t>{escape(segment)}</a:t></a:r>')
+    return f"<a:p>{''.join(parts)}</a:p>"
+
+# Title slide styling per presentation style; Pt/RGBColor values are immutable, so they're built once and shared
+STYLE_TABLE: Dict[str, Dict[str, Any]] = {
+    'creative': {
+        'title_size': Pt(44), 'title_color': RGBColor(0, 102, 204), 'title_bold': True,
+        'subtitle_size': Pt(24), 'subtitle_color': RGBColor(51, 51, 51),
+    },
+    'minimalist': {
+        'title_size': Pt(36), 'title_color': RGBColor(0, 0, 0), 'title_bold': True,
+        'subtitle_size': Pt(18), 'subtitle_color': RGBColor(100, 100, 100),
+    },
+    'professional': {
+        'title_size': Pt(40), 'title_color': RGBColor(0, 0, 0), 'title_bold': True,
+        'subtitle_size': Pt(20), 'subtitle_color': RGBColor(64, 64, 64),
+    },
+}
+
+# Downloads at or below this size in a format PowerPoint renders natively are embedded as-is when they
+# don't need shrinking, skipping the decode/resize/re-encode cycle
+PASSTHROUGH_IMAGE_MAX_BYTES = 500_000
+PASSTHROUGH_IMAGE_TYPES = frozenset(('image/png', 'image/jpeg'))
+
+RESIZED_IMAGE_CACHE_MAX_BYTES = int(os.getenv('RESIZED_IMAGE_CACHE_MAX_BYTES', 100 * 1024 * 1024))
+
+class _ResizedImageCache:
+    """Process-wide LRU of downloaded+resized images, bounded by total encoded size rather than entry count"""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int, int], Tuple[bytes, int, int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple[str, int, int]) -> Optional[Tuple[bytes, int, int]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def put(self, key: Tuple[str, int, int], entry: Tuple[bytes, int, int]):
+        size = len(entry[0])
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[0])
+            self._entries[key] = entry
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted[0])
+
+_resized_images = _ResizedImageCache(RESIZED_IMAGE_CACHE_MAX_BYTES)
+
+# URL -> SHA-256 of its content, so a known URL can be served from the resized cache without downloading
+URL_DIGEST_CACHE_SIZE = 4096
+
 class PresentationGenerator:
     def __init__(self):
         self.output_dir = os.getenv('PRESENTATION_OUTPUT_DIR', './generated_presentations')
         self.pdf_generator = PDFGenerator()
+        self._http = self._create_http_session()
+        self._office_listener: Optional[asyncio.subprocess.Process] = None
+        # PPTX previews need LibreOffice (directly or through unoconv) to convert the deck to PDF
+        self.can_render_previews = bool(shutil.which(UNOCONV_BIN) or shutil.which(SOFFICE_BIN))
+        self._show_slide_numbers = os.getenv('PPTX_SLIDE_NUMBERS', '1') == '1'
+        self._url_digests: "OrderedDict[str, str]" = OrderedDict()
+        self._url_digests_lock = threading.Lock()
         self.ensure_output_dir()
     
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """Pooled keep-alive session for image downloads, so repeated hosts reuse TCP/TLS connections"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
     def ensure_output_dir(self):
         """Ensure output directory exists"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
     
     async def generate_presentation(
         self,
@@ -35,25 +165,17 @@ class PresentationGenerator:
         """Generate a PDF presentation from selected slides"""
         
         try:
-            print(f"🎨 PDF PRESENTATION GENERATOR STARTED")
-            print(f"   - Presentation ID: {presentation_id}")
-            print(f"   - Total Slides: {len(slides)}")
-            print(f"   - Customer: {request_data.get('customer', 'N/A')}")
-            print(f"   - Industry: {request_data.get('industry', 'N/A')}")
-            print(f"   - Style: {request_data.get('style', 'N/A')}")
-            
-            # Debug: Check slide data
-            for i, slide in enumerate(slides):
-                print(f"🔍 SLIDE {i+1} DATA:")
-                print(f"   - Title: {slide.get('title', 'N/A')}")
-                print(f"   - Images: {len(slide.get('images', []))} visual elements")
-                print(f"   - Formatting: {bool(slide.get('formatting'))}")
-                print(f"   - Layout: {bool(slide.get('layout_info'))}")
-            
-            # Use PDF generator instead of PowerPoint
+            # Debug: Check slide data (skipped entirely unless DEBUG is enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, slide in enumerate(slides):
+                    logger.debug(
+                        "🔍 slide %d: title=%s images=%d formatting=%s layout=%s",
+                        i + 1, slide.get('title', 'N/A'), len(slide.get('images', []) or []),
+                        bool(slide.get('formatting')), bool(slide.get('layout_info'))
+                    )
+            
+            # Use PDF generator instead of PowerPoint (it logs the start/finish summary)
             result = await self.pdf_generator.generate_presentation(slides, presentation_id, request_data)
-            
-            print(f"✅ PDF presentation generated successfully")
             return result
             
         except Exception as e:
@@ -170,19 +292,14 @@ class PresentationGenerator:
         """Add quote slide content"""
         
         # Use a text box for quote
-        left = Inches(1)
-        top = Inches(2)
-        width = Inches(8)
-        height = Inches(3)
-        
-        textbox = slide.shapes.add_textbox(left, top, width, height)
+        textbox = slide.shapes.add_textbox(*QUOTE_BOX)
         text_frame = textbox.text_frame
         text_frame.text = f'"{slide_data.get("content", "Quote content")}"'
         
         # Style the quote
         paragraph = text_frame.paragraphs[0]
         paragraph.alignment = PP_ALIGN.CENTER
-        paragraph.font.size = Pt(24)
+        paragraph.font.size = QUOTE_FONT_SIZE
         paragraph.font.italic = True
     
     def _add_standard_content(self, slide, slide_data: Dict[str, Any]):
@@ -193,61 +310,108 @@ class PresentationGenerator:
         
         if len(slide.placeholders) > 1:
             content = slide.placeholders[1]
-            content.text = slide_data.get('content', '')
             
             # Format content as bullet points
             text_frame = content.text_frame
             text_frame.clear()
             
-            # Split content into bullet points
+            # Split content into bullet points, built as one XML fragment instead of a paragraph object per line
             content_text = slide_data.get('content', '')
-            if content_text:
-                points = content_text.split('\n')
-                for i, point in enumerate(points):
-                    if point.strip():
-                        if i == 0:
-                            p = text_frame.paragraphs[0]
-                        else:
-                            p = text_frame.add_paragraph()
-                        p.text = point.strip()
-                        p.level = 0
+            points = [point.strip() for point in content_text.split('\n')] if content_text else []
+            if any(points):
+                # A blank first line keeps the empty paragraph clear() left behind; other blank lines are dropped
+                if not points[0]:
+                    points = [''] + [point for point in points if point]
+                else:
+                    points = [point for point in points if point]
+                fragment = parse_xml(f"<a:txBody {nsdecls('a')}>{''.join(_bullet_paragraph_xml(point) for point in points)}</a:txBody>")
+                new_paragraphs = list(fragment)
+                
+                txBody = text_frame._txBody
+                first_paragraph = txBody.p_lst[0]
+                if first_paragraph.pPr is not None:
+                    if new_paragraphs[0].pPr is not None:
+                        new_paragraphs[0].remove(new_paragraphs[0].pPr)
+                    new_paragraphs[0].insert(0, first_paragraph.pPr)
+                txBody.replace(first_paragraph, new_paragraphs[0])
+                txBody.extend(new_paragraphs[1:])
+    
+    def _fetch_and_resize(self, image_url: str, max_width: int, max_height: int) -> Tuple[bytes, int, int]:
+        """Download and resize an image to fit max_width x max_height; returns (image bytes, width, height)
+        
+        Results are cached by SHA-256 of the downloaded content, so the same picture behind
+        different URLs is only decoded and resized once; URLs already seen skip the download too.
+        """
+        with self._url_digests_lock:
+            digest = self._url_digests.get(image_url)
+            if digest is not None:
+                self._url_digests.move_to_end(image_url)
+        if digest is not None:
+            cached = _resized_images.get((digest, max_width, max_height))
+            if cached is not None:
+                return cached
+        
+        # Download image
+        with self._http.get(image_url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            content = response.content
+            content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+        
+        digest = hashlib.sha256(content).hexdigest()
+        with self._url_digests_lock:
+            self._url_digests[image_url] = digest
+            self._url_digests.move_to_end(image_url)
+            if len(self._url_digests) > URL_DIGEST_CACHE_SIZE:
+                self._url_digests.popitem(last=False)
+        
+        key = (digest, max_width, max_height)
+        cached = _resized_images.get(key)
+        if cached is not None:
+            return cached
+        
+        # Open image and resize if needed (open() only reads the header; pixels are decoded on first use)
+        image = Image.open(BytesIO(content))
+        
+        # Calculate new size maintaining aspect ratio
+        width_ratio = max_width / image.width
+        height_ratio = max_height / image.height
+        ratio = min(width_ratio, height_ratio)
+        
+        new_width = int(image.width * ratio)
+        new_height = int(image.height * ratio)
+        
+        # Already small enough: embed the original bytes and let the slide scale the picture up to size
+        if (
+            ratio >= 1
+            and content_type in PASSTHROUGH_IMAGE_TYPES
+            and image.format in ('PNG', 'JPEG')
+            and len(content) <= PASSTHROUGH_IMAGE_MAX_BYTES
+        ):
+            entry = (content, new_width, new_height)
+            _resized_images.put(key, entry)
+            return entry
+        
+        # Let libjpeg decode oversized JPEGs at 1/2, 1/4 or 1/8 scale (no-op for other formats);
+        # keep at least 2x the target so the final LANCZOS pass still has detail to work with
+        image.draft('RGB', (new_width * 2, new_height * 2))
+        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        
+        # Keep the resized image, not the original, so memory use doesn't depend on source resolution
+        buffer = BytesIO()
+        image.save(buffer, format='PNG', optimize=False)
+        entry = (buffer.getvalue(), new_width, new_height)
+        _resized_images.put(key, entry)
+        return entry
     
     def _add_image_from_url(self, slide, image_url: str):
         """Add image to slide from URL"""
         
         try:
-            # Download image
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            
-            # Open image and resize if needed
-            image = Image.open(BytesIO(response.content))
-            
-            # Resize image to fit slide
-            max_width = Inches(8)
-            max_height = Inches(5)
+            # Resize image to fit an 8x5 inch area (in pixels)
+            image_bytes, new_width, new_height = self._fetch_and_resize(image_url, 8 * IMAGE_DPI, 5 * IMAGE_DPI)
             
-            # Calculate new size maintaining aspect ratio
-            width_ratio = max_width / image.width
-            height_ratio = max_height / image.height
-            ratio = min(width_ratio, height_ratio)
-            
-            new_width = int(image.width * ratio)
-            new_height = int(image.height * ratio)
-            
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Save to temporary file
-            temp_path = f"/tmp/temp_image_{uuid.uuid4()}.png"
-            image.save(temp_path)
-            
-            # Add image to slide
-            left = Inches(1)
-            top = Inches(2)
-            slide.shapes.add_picture(temp_path, left, top, width=Inches(new_width/96), height=Inches(new_height/96))
-            
-            # Clean up temp file
-            os.remove(temp_path)
+            # Add image to slide straight from memory
+            slide.shapes.add_picture(BytesIO(image_bytes), IMAGE_LEFT, IMAGE_TOP, width=Emu(new_width * EMU_PER_PIXEL), height=Emu(new_height * EMU_PER_PIXEL))
             
         except Exception as e:
             logger.error(f"Error adding image from URL: {e}")
@@ -255,22 +419,19 @@ class PresentationGenerator:
     
     def _add_slide_number(self, slide, slide_number: int):
         """Add slide number to slide"""
+        if not self._show_slide_numbers:
+            return
         
         # Add slide number in bottom right corner
-        left = Inches(9)
-        top = Inches(7)
-        width = Inches(1)
-        height = Inches(0.5)
-        
-        textbox = slide.shapes.add_textbox(left, top, width, height)
+        textbox = slide.shapes.add_textbox(*SLIDE_NUMBER_BOX)
         text_frame = textbox.text_frame
         text_frame.text = str(slide_number)
         
         # Style the slide number
         paragraph = text_frame.paragraphs[0]
         paragraph.alignment = PP_ALIGN.RIGHT
-        paragraph.font.size = Pt(12)
-        paragraph.font.color.rgb = RGBColor(128, 128, 128)
+        paragraph.font.size = SLIDE_NUMBER_FONT_SIZE
+        paragraph.font.color.rgb = MUTED_GRAY
     
     def _add_conclusion_slide(self, prs: Presentation, request_data: Dict[str, Any]):
         """Add conclusion slide to presentation"""
@@ -289,64 +450,116 @@ class PresentationGenerator:
     def _style_title_slide(self, slide, style: str):
         """Style the title slide based on presentation style"""
         
-        if style == 'creative':
-            # Creative styling
-            if slide.shapes.title:
-                title_para = slide.shapes.title.text_frame.paragraphs[0]
-                title_para.font.size = Pt(44)
-                title_para.font.color.rgb = RGBColor(0, 102, 204)
-                title_para.font.bold = True
-            
-            if len(slide.placeholders) > 1:
-                subtitle_para = slide.placeholders[1].text_frame.paragraphs[0]
-                subtitle_para.font.size = Pt(24)
-                subtitle_para.font.color.rgb = RGBColor(51, 51, 51)
-        
-        elif style == 'minimalist':
-            # Minimalist styling
-            if slide.shapes.title:
-                title_para = slide.shapes.title.text_frame.paragraphs[0]
-                title_para.font.size = Pt(36)
-                title_para.font.color.rgb = RGBColor(0, 0, 0)
-                title_para.font.bold = True
-            
-            if len(slide.placeholders) > 1:
-                subtitle_para = slide.placeholders[1].text_frame.paragraphs[0]
-                subtitle_para.font.size = Pt(18)
-                subtitle_para.font.color.rgb = RGBColor(100, 100, 100)
-        
-        else:  # professional/corporate
-            # Professional styling
-            if slide.shapes.title:
-                title_para = slide.shapes.title.text_frame.paragraphs[0]
-                title_para.font.size = Pt(40)
-                title_para.font.color.rgb = RGBColor(0, 0, 0)
-                title_para.font.bold = True
-            
-            if len(slide.placeholders) > 1:
-                subtitle_para = slide.placeholders[1].text_frame.paragraphs[0]
-                subtitle_para.font.size = Pt(20)
-                subtitle_para.font.color.rgb = RGBColor(64, 64, 64)
+        # Anything other than creative/minimalist gets the professional/corporate look
+        cfg = STYLE_TABLE.get(style, STYLE_TABLE['professional'])
+        
+        if slide.shapes.title:
+            title_font = slide.shapes.title.text_frame.paragraphs[0].font
+            title_font.size = cfg['title_size']
+            title_font.color.rgb = cfg['title_color']
+            title_font.bold = cfg['title_bold']
+        
+        if len(slide.placeholders) > 1:
+            subtitle_font = slide.placeholders[1].text_frame.paragraphs[0].font
+            subtitle_font.size = cfg['subtitle_size']
+            subtitle_font.color.rgb = cfg['subtitle_color']
+    
+    async def start_preview_renderer(self):
+        """Start a persistent LibreOffice listener (via unoconv) so preview conversions skip the office cold start"""
+        if self._office_listener is not None and self._office_listener.returncode is None:
+            return
+        if not shutil.which(UNOCONV_BIN):
+            logger.info("unoconv not found; previews will start %s per conversion", SOFFICE_BIN)
+            return
+        try:
+            self._office_listener = await asyncio.create_subprocess_exec(
+                UNOCONV_BIN, '--listener',
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            logger.info("Started LibreOffice preview listener (pid %s)", self._office_listener.pid)
+        except OSError as e:
+            logger.warning(f"Could not start LibreOffice preview listener: {e}")
+            self._office_listener = None
+    
+    async def close(self):
+        """Stop the LibreOffice listener and close the image download session"""
+        if self._office_listener is not None and self._office_listener.returncode is None:
+            self._office_listener.terminate()
+            await self._office_listener.wait()
+        self._office_listener = None
+        self._http.close()
+    
+    async def _convert_to_pdf(self, filepath: str) -> str:
+        """Convert a PPTX to PDF next to it, reusing the previous PDF if the deck hasn't changed since"""
+        pdf_path = os.path.splitext(filepath)[0] + '.pdf'
+        
+        def is_current() -> bool:
+            try:
+                return os.stat(pdf_path).st_mtime_ns >= os.stat(filepath).st_mtime_ns
+            except OSError:
+                return False
+        
+        if await asyncio.to_thread(is_current):
+            return pdf_path
+        
+        if self._office_listener is not None and self._office_listener.returncode is None:
+            # unoconv connects to the running listener instead of launching LibreOffice
+            command = [UNOCONV_BIN, '-f', 'pdf', '-o', pdf_path, filepath]
+        else:
+            command = [SOFFICE_BIN, '--headless', '--convert-to', 'pdf', '--outdir', os.path.dirname(pdf_path) or '.', filepath]
+        
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=PREVIEW_CONVERT_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise RuntimeError(f"PDF conversion timed out after {PREVIEW_CONVERT_TIMEOUT}s")
+        if process.returncode != 0 or not await asyncio.to_thread(os.path.exists, pdf_path):
+            raise RuntimeError(f"PDF conversion failed: {stderr.decode(errors='replace').strip()}")
+        return pdf_path
     
     async def _generate_preview_images(self, filepath: str, presentation_id: str) -> List[str]:
-        """Generate preview images for the presentation"""
+        """Generate preview images for the presentation
+        
+        The deck is converted to PDF once, then rendered by the PDF generator's thumbnailer, which
+        rasterizes pages with pdftocairo and caches the images per presentation and file version.
+        """
         
         try:
-            # This would integrate with a service to convert PPTX to images
-            # For now, return placeholder URLs
-            preview_urls = []
-            
-            # In a real implementation, you would:
-            # 1. Convert PPTX to images using a service like LibreOffice or cloud API
-            # 2. Upload images to cloud storage
-            # 3. Return the URLs
-            
-            return preview_urls
+            pdf_path = await self._convert_to_pdf(filepath)
+            return await self.pdf_generator._generate_preview_images(pdf_path, presentation_id)
             
         except Exception as e:
             logger.error(f"Error generating preview images: {e}")
             return []
     
+    async def render_pptx_previews(self, filepath: str, presentation_id: str, discard_source: bool = False) -> List[str]:
+        """Preview images for a generated PPTX; with discard_source, the deck and its PDF are deleted afterwards
+        
+        discard_source is for decks written locally only so they could be previewed (the copy users
+        download lives in object storage).
+        """
+        try:
+            return await self._generate_preview_images(filepath, presentation_id)
+        finally:
+            if discard_source:
+                await asyncio.to_thread(self._remove_files, filepath, os.path.splitext(filepath)[0] + '.pdf')
+    
+    @staticmethod
+    def _remove_files(*paths: str):
+        """Delete files, ignoring ones that are already gone"""
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
     def _copy_exact_slide(self, prs: Presentation, slide_data: Dict[str, Any], slide_number: int):
         """Copy exact slide from source with enhanced visual element preservation"""
         
@@ -394,7 +607,7 @@ class PresentationGenerator:
         # Copy exact image if available (legacy support)
         if slide_data.get('imageUrl'):
             try:
-                self._add_slide_image(slide, slide_data['imageUrl'])
+                self._add_image_from_url(slide, slide_data['imageUrl'])
             except Exception as e:
                 logger.warning(f"Could not add image to slide {slide_number}: {e}")
         
@@ -430,7 +643,7 @@ class PresentationGenerator:
         # Add image if available
         if slide_data.get('imageUrl'):
             try:
-                self._add_slide_image(slide, slide_data['imageUrl'])
+                self._add_image_from_url(slide, slide_data['imageUrl'])
             except Exception as e:
                 logger.warning(f"Could not add image to slide {slide_number}: {e}")
         
@@ -459,7 +672,7 @@ class PresentationGenerator:
         # Add image if available
         if slide_data.get('imageUrl'):
             try:
-                self._add_slide_image(slide, slide_data['imageUrl'])
+                self._add_image_from_url(slide, slide_data['imageUrl'])
             except Exception as e:
                 logger.warning(f"Could not add image to slide {slide_number}: {e}")
         
@@ -490,22 +703,19 @@ class PresentationGenerator:
     
     def _add_source_attribution(self, slide, slide_data: Dict[str, Any]):
         """Add source attribution to slide"""
-        source = slide_data.get('sourcePresentation', '')
-        if source:
-            # Add small text box with source info
-            left = Inches(0.5)
-            top = Inches(6.5)
-            width = Inches(9)
-            height = Inches(0.5)
-            
-            textbox = slide.shapes.add_textbox(left, top, width, height)
-            text_frame = textbox.text_frame
-            text_frame.text = f"Source: {source}"
-            
-            # Style the text
-            paragraph = text_frame.paragraphs[0]
-            paragraph.font.size = Pt(8)
-            paragraph.font.color.rgb = RGBColor(128, 128, 128)
+        source = slide_data.get('sourcePresentation')
+        if not source or not str(source).strip():
+            return
+        
+        # Add small text box with source info
+        textbox = slide.shapes.add_textbox(*SOURCE_BOX)
+        text_frame = textbox.text_frame
+        text_frame.text = f"Source: {source}"
+        
+        # Style the text
+        paragraph = text_frame.paragraphs[0]
+        paragraph.font.size = SOURCE_FONT_SIZE
+        paragraph.font.color.rgb = MUTED_GRAY
     
     def _apply_text_formatting(self, shape, formatting: Dict[str, Any]):
         """Apply text formatting to a shape"""
@@ -522,16 +732,8 @@ class PresentationGenerator:
             # Apply paragraph formatting
             if 'paragraph' in formatting:
                 para_format = formatting['paragraph']
-                if para_format.get('alignment'):
-                    # Convert string alignment to enum
-                    alignment_map = {
-                        'PP_ALIGN.LEFT': PP_ALIGN.LEFT,
-                        'PP_ALIGN.CENTER': PP_ALIGN.CENTER,
-                        'PP_ALIGN.RIGHT': PP_ALIGN.RIGHT,
-                        'PP_ALIGN.JUSTIFY': PP_ALIGN.JUSTIFY
-                    }
-                    if para_format['alignment'] in alignment_map:
-                        para.alignment = alignment_map[para_format['alignment']]
+                if para_format.get('alignment') in ALIGNMENT_MAP:
+                    para.alignment = ALIGNMENT_MAP[para_format['alignment']]
             
             # Apply font formatting
             if 'font' in formatting and para.runs:
@@ -551,13 +753,9 @@ class PresentationGenerator:
                 if font_format.get('color'):
                     # Parse color string and apply
                     try:
-                        color_str = font_format['color']
-                        if color_str.startswith('RGBColor('):
-                            # Extract RGB values
-                            rgb_values = color_str[9:-1].split(', ')
-                            if len(rgb_values) == 3:
-                                r, g, b = map(int, rgb_values)
-                                run.font.color.rgb = RGBColor(r, g, b)
+                        match = _RGB_RE.match(font_format['color'])
+                        if match:
+                            run.font.color.rgb = RGBColor(int(match[1]), int(match[2]), int(match[3]))
                     except Exception as e:
                         logger.warning(f"Could not apply color formatting: {e}")
                         
@@ -588,37 +786,14 @@ class PresentationGenerator:
                 logger.warning("No image data available")
                 return
                 
-            # Save image data to temporary file
-            import tempfile
-            import uuid
-            
-            # Determine file extension from format
-            image_format = image_data.get('image_format', 'png')
-            if 'jpeg' in image_format.lower():
-                ext = '.jpg'
-            elif 'png' in image_format.lower():
-                ext = '.png'
-            elif 'gif' in image_format.lower():
-                ext = '.gif'
-            else:
-                ext = '.png'  # Default
-                
-            temp_path = f"/tmp/extracted_image_{uuid.uuid4()}{ext}"
-            
-            # Write image data to file
-            with open(temp_path, 'wb') as f:
-                f.write(image_data['image_data'])
-            
             # Add image to slide with original positioning
-            left = image_data.get('left', Inches(1))
-            top = image_data.get('top', Inches(2))
-            width = image_data.get('width', Inches(4))
-            height = image_data.get('height', Inches(3))
-            
-            slide.shapes.add_picture(temp_path, left, top, width, height)
+            left = image_data.get('left', IMAGE_LEFT)
+            top = image_data.get('top', IMAGE_TOP)
+            width = image_data.get('width', EXTRACTED_IMAGE_WIDTH)
+            height = image_data.get('height', EXTRACTED_IMAGE_HEIGHT)
             
-            # Clean up temp file
-            os.remove(temp_path)
+            # python-pptx detects the format from the bytes, so no temp file (or extension) is needed
+            slide.shapes.add_picture(BytesIO(image_data['image_data']), left, top, width, height)
             
         except Exception as e:
             logger.error(f"Error adding extracted image: {e}")
@@ -60,7 +60,7 @@ const initializeTables = async (): Promise<void> => {
         style VARCHAR(50),
         additional_requirements TEXT,
         download_url VARCHAR(500),
-        preview_url VARCHAR(500),
+        preview_url TEXT,
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
       )
@@ -176,6 +176,13 @@ const initializeTables = async (): Promise<void> => {
       ADD COLUMN IF NOT EXISTS user_type VARCHAR(50) DEFAULT 'user'
     `);
 
+    // preview_url holds a JSON array of preview image URLs, which outgrows VARCHAR(500) past a few pages
+    // (VARCHAR -> TEXT is binary compatible, so this doesn't rewrite the table)
+    await client.query(`
+      ALTER TABLE presentations 
+      ALTER COLUMN preview_url TYPE TEXT
+    `);
+
     // Add enhanced visual data columns to source_slides table
     await client.query(`
       ALTER TABLE source_slides 
@@ -184,6 +191,112 @@ const initializeTables = async (): Promise<void> => {
       ADD COLUMN IF NOT EXISTS layout_info JSONB
     `);
 
+    // Classify slides in the database (mirrors the AI service keyword rules) so slide type can be indexed.
+    // Keywords match anywhere in the text, like the AI service's substring checks.
+    await client.query(`
+      ALTER TABLE source_slides 
+      ADD COLUMN IF NOT EXISTS slide_type_auto VARCHAR(50) GENERATED ALWAYS AS (
+        CASE
+          WHEN lower(coalesce(title, '')) ~ '(title|agenda|overview)' THEN 'title'
+          WHEN lower(coalesce(content, '')) ~ '(chart|graph|data|statistics)' THEN 'chart'
+          WHEN lower(coalesce(content, '')) ~ '(quote|testimonial|feedback)' THEN 'quote'
+          WHEN lower(coalesce(content, '')) ~ '(conclusion|summary|next steps)' THEN 'conclusion'
+          ELSE 'content'
+        END
+      ) STORED
+    `);
+
+    await client.query(`
+      CREATE INDEX IF NOT EXISTS idx_source_slides_slide_type_auto 
+      ON source_slides(slide_type_auto)
+    `);
+
+    // Maintain slide_count on presentation_sources so source listings avoid a GROUP BY over source_slides
+    await client.query(`
+      ALTER TABLE presentation_sources 
+      ADD COLUMN IF NOT EXISTS slide_count INTEGER DEFAULT 0
+    `);
+
+    await client.query(`
+      CREATE OR REPLACE FUNCTION increment_source_slide_count() RETURNS TRIGGER AS $$
+      BEGIN
+        UPDATE presentation_sources ps
+        SET slide_count = ps.slide_count + counts.n
+        FROM (SELECT source_id, COUNT(*) AS n FROM new_slides GROUP BY source_id) counts
+        WHERE ps.id = counts.source_id;
+        RETURN NULL;
+      END;
+      $$ LANGUAGE plpgsql
+    `);
+
+    await client.query(`
+      CREATE OR REPLACE FUNCTION decrement_source_slide_count() RETURNS TRIGGER AS $$
+      BEGIN
+        UPDATE presentation_sources ps
+        SET slide_count = GREATEST(ps.slide_count - counts.n, 0)
+        FROM (SELECT source_id, COUNT(*) AS n FROM old_slides GROUP BY source_id) counts
+        WHERE ps.id = counts.source_id;
+        RETURN NULL;
+      END;
+      $$ LANGUAGE plpgsql
+    `);
+
+    // Statement-level triggers so a bulk COPY of slides costs one UPDATE per source
+    await client.query(`
+      DROP TRIGGER IF EXISTS trg_source_slides_count_insert ON source_slides;
+      CREATE TRIGGER trg_source_slides_count_insert
+      AFTER INSERT ON source_slides
+      REFERENCING NEW TABLE AS new_slides
+      FOR EACH STATEMENT EXECUTE FUNCTION increment_source_slide_count();
+      DROP TRIGGER IF EXISTS trg_source_slides_count_delete ON source_slides;
+      CREATE TRIGGER trg_source_slides_count_delete
+      AFTER DELETE ON source_slides
+      REFERENCING OLD TABLE AS old_slides
+      FOR EACH STATEMENT EXECUTE FUNCTION decrement_source_slide_count();
+    `);
+
+    // Resync counts for slides stored before the triggers existed
+    await client.query(`
+      UPDATE presentation_sources ps
+      SET slide_count = counts.n
+      FROM (
+        SELECT p.id, COUNT(ss.id) AS n
+        FROM presentation_sources p
+        LEFT JOIN source_slides ss ON ss.source_id = p.id
+        GROUP BY p.id
+      ) counts
+      WHERE ps.id = counts.id AND ps.slide_count IS DISTINCT FROM counts.n
+    `);
+
+    // Covering index for the AI service's source listings: keys serve the filter and ORDER BY,
+    // INCLUDE carries the projected summary columns so listings can be answered by index-only scans
+    await client.query(`
+      CREATE INDEX IF NOT EXISTS idx_presentation_sources_listing 
+      ON presentation_sources(industry, status, relevance_score DESC, created_at DESC)
+      INCLUDE (id, title, tags, file_path, slide_count)
+    `);
+
+    // Full-text search vector for slide text, matched by the AI service's slide search
+    await client.query(`
+      ALTER TABLE source_slides 
+      ADD COLUMN IF NOT EXISTS search_tsv tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))
+      ) STORED
+    `);
+
+    await client.query(`
+      CREATE INDEX IF NOT EXISTS idx_source_slides_search_tsv 
+      ON source_slides USING GIN (search_tsv)
+    `);
+
+    // Trigram indexes let the '%term%' ILIKE match on source title/description use an index instead of a sequential scan
+    await client.query(`CREATE EXTENSION IF NOT EXISTS pg_trgm`);
+
+    await client.query(`
+      CREATE INDEX IF NOT EXISTS idx_presentation_sources_title_trgm ON presentation_sources USING GIN (title gin_trgm_ops);
+      CREATE INDEX IF NOT EXISTS idx_presentation_sources_description_trgm ON presentation_sources USING GIN (description gin_trgm_ops);
+    `);
+
     // Training system tables
     await client.query(`
       CREATE TABLE IF NOT EXISTS training_sessions (